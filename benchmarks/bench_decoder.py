@@ -0,0 +1,48 @@
+# Compares dataclass_wizard's fromdict with the compiled loaders in utils/decoder.py.
+# Usage: python benchmarks/bench_decoder.py [--number N]
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from dataclass_wizard import fromdict
+
+import payloads
+from valorantClientAPI.response.core_game import CoreGameDetails
+from valorantClientAPI.response.mmr import MatchDetails, MatchHistory
+from valorantClientAPI.response.pre_game import PreGameDetails
+from valorantClientAPI.utils.decoder import decode
+
+CASES = [
+    ("MatchDetails", MatchDetails, payloads.match_details()),
+    ("MatchHistory", MatchHistory, payloads.match_history()),
+    ("CoreGameDetails", CoreGameDetails, payloads.core_game_details()),
+    ("PreGameDetails", PreGameDetails, payloads.pre_game_details()),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{'model':<18}{'fromdict ms':>14}{'decode ms':>12}{'speedup':>10}")
+    for name, cls, data in CASES:
+        new = min(timeit.repeat(lambda: decode(cls, data), number=args.number, repeat=3)) / args.number
+        try:
+            expected = fromdict(cls, data)
+        except Exception as err:
+            # dataclass_wizard 0.22 can't load typing.Any fields on Python 3.11+
+            print(f"{name:<18}{'n/a':>14}{new * 1000:>12.3f}{'':>10}  ({type(err).__name__})")
+            continue
+        if decode(cls, data) != expected:
+            raise SystemExit(f"{name}: decode and fromdict results differ")
+        old = min(timeit.repeat(lambda: fromdict(cls, data), number=args.number, repeat=3)) / args.number
+        print(f"{name:<18}{old * 1000:>14.3f}{new * 1000:>12.3f}{old / new:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
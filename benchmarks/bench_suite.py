@@ -0,0 +1,305 @@
+# Offline benchmark suite: response model parsing, json decoding, rate limiter overhead and
+# per-request overhead of the Client methods against a local stand-in server (server.py).
+# Results are written as json so runs can be compared between releases.
+# Usage: python benchmarks/bench_suite.py [--quick] [--only parse,decode,limiter,client] [--output FILE]
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+from importlib import metadata
+from typing import Callable, Dict, List, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.dirname(__file__))
+
+import aiohttp
+from dataclass_wizard import fromdict
+
+import payloads
+from server import MATCH_ID, PUUID, LocalSession, StandInServer
+from valorantClientAPI.client import Client, content_verify
+from valorantClientAPI.response.core_game import CoreGameDetails, CoreGameMatchLoadout
+from valorantClientAPI.response.errors import httpStatusError
+from valorantClientAPI.response.mmr import MatchDetails, MatchHistory
+from valorantClientAPI.response.pre_game import PreGameDetails
+from valorantClientAPI.utils import jsonlib, version
+from valorantClientAPI.utils.decoder import decode
+from valorantClientAPI.utils.limiter import DEFAULT_RATES, Limiter, RateLimiter
+
+SUITE_VERSION = 1
+SECTIONS = ("parse", "decode", "limiter", "client")
+
+MODELS = [
+    ("MatchDetails", MatchDetails, payloads.match_details()),
+    ("MatchHistory", MatchHistory, payloads.match_history()),
+    ("CoreGameDetails", CoreGameDetails, payloads.core_game_details()),
+    ("CoreGameMatchLoadout", CoreGameMatchLoadout, payloads.core_game_loadouts()),
+    ("PreGameDetails", PreGameDetails, payloads.pre_game_details()),
+]
+
+BODIES = [(name, data) for name, _, data in MODELS] + [("Leaderboard", payloads.leaderboard())]
+
+# Client method, args
+CLIENT_CALLS = [
+    ("RSO_GetPlayerInfo", ()),
+    ("Content_FetchContent", ()),
+    ("AccountXP_GetPlayer", ()),
+    ("MMR_FetchPlayer", ()),
+    ("MatchHistory_FetchMatchHistory", ()),
+    ("MatchDetails_FetchMatchDetails", (MATCH_ID,)),
+    ("MMR_FetchCompetitiveUpdates", ()),
+    ("MMR_FetchLeaderboard", ("season",)),
+    ("Restrictions_FetchPlayerRestrictionsV2", ()),
+    ("ItemProgressionDefinitionsV2_Fetch", ()),
+    ("Config_FetchConfig", ()),
+    ("Pregame_GetPlayer", ()),
+    ("Pregame_GetMatch", (None, MATCH_ID)),
+    ("CoreGame_GetPlayer", ()),
+    ("CoreGame_FetchMatch", (None, MATCH_ID)),
+    ("CoreGame_FetchMatchLoadouts", (None, MATCH_ID)),
+    ("Store_GetOffers", ()),
+    ("Store_GetStorefrontV2", ()),
+    ("Store_GetWallet", ()),
+    ("Store_GetOrder", ("order",)),
+    ("Store_GetEntitlements", ("type",)),
+    ("PlayerPref_SavePreferenceV3", ()),
+    ("get_username_from_ids", (None, [PUUID])),
+]
+
+
+def _best(func: Callable, number: int, repeat: int = 3) -> float:
+    """Seconds per call, best of `repeat` runs."""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def _rate(seconds: float) -> Dict[str, float]:
+    return {"mean_us": seconds * 1e6, "ops_per_s": 1 / seconds if seconds else None}
+
+
+def _percentiles(samples: List[float]) -> Dict[str, float]:
+    samples = sorted(samples)
+    return {
+        "mean_us": statistics.fmean(samples) * 1e6,
+        "p50_us": samples[len(samples) // 2] * 1e6,
+        "p95_us": samples[min(len(samples) - 1, int(len(samples) * 0.95))] * 1e6,
+    }
+
+
+def bench_parse(number: int) -> Dict:
+    """Building each response model from decoded json: compiled loaders vs dataclass_wizard's fromdict."""
+    results = {}
+    for name, cls, data in MODELS:
+        result = {"decode": _rate(_best(lambda: decode(cls, data), number))}
+        try:
+            fromdict(cls, data)
+            result["fromdict"] = _rate(_best(lambda: fromdict(cls, data), number))
+        except Exception as err:
+            # dataclass_wizard 0.22 can't load typing.Any fields on Python 3.11+
+            result["fromdict"] = {"error": type(err).__name__}
+        results[name] = result
+    return results
+
+
+class _Body:
+    """The parts of a response content_verify reads."""
+    def __init__(self, body: bytes):
+        self.body = body
+        self.headers = {"Content-Type": "application/json; charset=utf-8"}
+
+    async def read(self) -> bytes:
+        return self.body
+
+
+def bench_decode(number: int) -> Dict:
+    """content_verify on each fixture body, with every installed json decoder."""
+    loop = asyncio.new_event_loop()
+    previous = jsonlib.name if jsonlib.name in jsonlib.DECODERS else jsonlib.loads
+    results = {}
+    try:
+        for decoder in jsonlib.DECODERS:
+            jsonlib.configure(decoder)
+            results[decoder] = {}
+            for name, data in BODIES:
+                body = json.dumps(data).encode()
+                response = _Body(body)
+
+                async def run():
+                    for _ in range(number):
+                        await content_verify(response)
+
+                seconds = min(timeit.repeat(lambda: loop.run_until_complete(run()), number=1, repeat=3)) / number
+                results[decoder][name] = {"bytes": len(body), **_rate(seconds), "mb_per_s": len(body) / seconds / 1e6}
+    finally:
+        jsonlib.configure(previous)
+        loop.close()
+    return results
+
+
+async def _concurrently(concurrency: int, total: int, step: Callable) -> float:
+    """Seconds per step when `total` steps are run by `concurrency` tasks."""
+    per_task = max(1, total // concurrency)
+
+    async def worker():
+        for _ in range(per_task):
+            await step()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return (time.perf_counter() - start) / (per_task * concurrency)
+
+
+async def _noop():
+    pass
+
+
+async def bench_limiter(total: int) -> Dict:
+    """
+    Uncontended acquire overhead at several concurrency levels, against awaiting a no-op
+    coroutine, and how closely a contended RateLimiter keeps to its rate.
+    """
+    results = {"baseline": {}, "RateLimiter": {}, "Limiter": {}}
+    for concurrency in (1, 100, 1000):
+        key = str(concurrency)
+        results["baseline"][key] = {"ns_per_op": await _concurrently(concurrency, total, _noop) * 1e9}
+        limiter = RateLimiter({"other": (10 ** 12, 1)})
+        results["RateLimiter"][key] = {"ns_per_op": await _concurrently(concurrency, total, limiter.acquire) * 1e9}
+        legacy = Limiter(calls_limit=10 ** 9)(_noop)
+        results["Limiter"][key] = {"ns_per_op": await _concurrently(concurrency, total, legacy) * 1e9}
+
+    # 1000 burst tokens refilled at 10000/s: 6000 acquires should take 0.5s
+    limiter = RateLimiter({"other": (1000, 0.1)})
+    expected = (6000 - 1000) / 10000
+    start = time.perf_counter()
+    await _concurrently(1000, 6000, limiter.acquire)
+    elapsed = time.perf_counter() - start
+    results["RateLimiter_contended"] = {
+        "acquires": 6000,
+        "expected_s": expected,
+        "elapsed_s": elapsed,
+        "pacing_error": (elapsed - expected) / expected,
+    }
+    return results
+
+
+async def bench_client(number: int) -> Dict:
+    """
+    Each Client method against the stand-in server, called `number` times, each time
+    next to a bare aiohttp request of the same url; overhead_us is what the client adds
+    to the median request (rate limiter, headers, decoding & parsing).
+    """
+    results = {}
+    async with StandInServer() as server:
+        session = LocalSession(server.port)
+        client = Client(
+            session=session,
+            client_version="bench",
+            access_token="token",
+            entitlements_token="entitlements",
+            rate_limiter=RateLimiter({family: (10 ** 12, 1) for family in DEFAULT_RATES}),
+        )
+        client.puuid = PUUID
+        try:
+            for name, args in CLIENT_CALLS:
+                method = getattr(client, name)
+                result = await method(*args)
+                if result is None or isinstance(result, httpStatusError):
+                    results[name] = {"error": repr(result)}
+                    continue
+                http_method, url = session.last
+
+                # Interleaved, so both see the same machine & server state
+                samples, raw = [], []
+                for _ in range(number):
+                    start = time.perf_counter()
+                    await method(*args)
+                    samples.append(time.perf_counter() - start)
+                    start = time.perf_counter()
+                    async with session.session.request(http_method, url) as resp:
+                        await resp.read()
+                    raw.append(time.perf_counter() - start)
+
+                timings = _percentiles(samples)
+                raw_timings = _percentiles(raw)
+                results[name] = {
+                    "requests": number,
+                    **timings,
+                    "raw_p50_us": raw_timings["p50_us"],
+                    "overhead_us": timings["p50_us"] - raw_timings["p50_us"],
+                }
+        finally:
+            await client.close()
+            await session.close()
+    return results
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "HEAD"], cwd=os.path.dirname(__file__), stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _version(distribution: str) -> Optional[str]:
+    try:
+        return metadata.version(distribution)
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def meta() -> Dict:
+    return {
+        "suite_version": SUITE_VERSION,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "valorantClientAPI": _version("valorantClientAPI"),
+        "aiohttp": aiohttp.__version__,
+        "dataclass_wizard": _version("dataclass-wizard"),
+        "json_decoder": jsonlib.name,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--quick", action="store_true", help="fewer iterations, for a smoke run")
+    parser.add_argument("--only", default=",".join(SECTIONS), help=f"comma separated sections: {', '.join(SECTIONS)}")
+    parser.add_argument("--output", help="write the json here instead of stdout")
+    args = parser.parse_args()
+
+    sections = [section.strip() for section in args.only.split(",") if section.strip()]
+    unknown = set(sections) - set(SECTIONS)
+    if unknown:
+        raise SystemExit(f"unknown sections: {', '.join(sorted(unknown))}")
+    number = 10 if args.quick else 100
+    version.configure(client_version="bench", riot_client_build="bench")
+
+    results = {"meta": meta()}
+    if "parse" in sections:
+        results["parse"] = bench_parse(number)
+    if "decode" in sections:
+        results["decode"] = bench_decode(number)
+    if "limiter" in sections:
+        results["limiter"] = asyncio.run(bench_limiter(10000 if args.quick else 100000))
+    if "client" in sections:
+        results["client"] = asyncio.run(bench_client(20 if args.quick else 200))
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
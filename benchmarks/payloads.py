@@ -0,0 +1,328 @@
+# Synthetic API payloads shaped like real responses, for offline benchmarks.
+# Values are random but deterministic for a given seed.
+import random
+import uuid
+from typing import Dict, List
+
+MAPS = ["/Game/Maps/Ascent/Ascent", "/Game/Maps/Bonsai/Bonsai", "/Game/Maps/Duality/Duality", "/Game/Maps/Triad/Triad"]
+
+
+def _uuid(rng: random.Random) -> str:
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+def _location(rng: random.Random) -> Dict[str, int]:
+    return {"x": rng.randint(-8000, 8000), "y": rng.randint(-8000, 8000)}
+
+
+def _player_locations(rng: random.Random, puuids: List[str]) -> List[Dict]:
+    return [
+        {"subject": puuid, "viewRadians": rng.uniform(0, 6.28), "location": _location(rng)}
+        for puuid in puuids
+    ]
+
+
+def match_details(seed: int = 0, rounds: int = 24, players: int = 10) -> Dict:
+    """A completed competitive match."""
+    rng = random.Random(seed)
+    puuids = [_uuid(rng) for _ in range(players)]
+    teams = {puuid: ("Blue" if index % 2 else "Red") for index, puuid in enumerate(puuids)}
+    match_id = _uuid(rng)
+
+    kills = []
+    round_results = []
+    for round_num in range(rounds):
+        round_kills = []
+        for _ in range(rng.randint(3, 9)):
+            killer, victim = rng.sample(puuids, 2)
+            game_time = round_num * 100000 + rng.randint(0, 100000)
+            round_kills.append({
+                "gameTime": game_time,
+                "roundTime": rng.randint(0, 100000),
+                "killer": killer,
+                "victim": victim,
+                "victimLocation": _location(rng),
+                "assistants": rng.sample(puuids, rng.randint(0, 2)),
+                "playerLocations": _player_locations(rng, puuids),
+                "finishingDamage": {"damageType": "Weapon", "damageItem": _uuid(rng), "isSecondaryFireMode": False},
+                "round": round_num,
+            })
+        kills.extend(round_kills)
+        round_results.append({
+            "roundNum": round_num,
+            "roundResult": "Eliminated",
+            "roundCeremony": "CeremonyDefault",
+            "winningTeam": rng.choice(["Red", "Blue"]),
+            "plantRoundTime": rng.randint(0, 100000),
+            "plantLocation": _location(rng),
+            "plantSite": rng.choice(["A", "B", ""]),
+            "defuseRoundTime": 0,
+            "defuseLocation": {"x": 0, "y": 0},
+            "roundResultCode": "Elimination",
+            "bombPlanter": rng.choice(puuids),
+            "plantPlayerLocations": _player_locations(rng, puuids),
+            "defusePlayerLocations": None,
+            "playerStats": [
+                {
+                    "subject": puuid,
+                    "kills": [kill for kill in round_kills if kill["killer"] == puuid],
+                    "damage": [
+                        {"receiver": rng.choice(puuids), "damage": rng.randint(0, 150), "legshots": 0, "bodyshots": 1, "headshots": 1}
+                    ],
+                    "score": rng.randint(0, 1000),
+                    "economy": {"loadoutValue": 3900, "weapon": _uuid(rng), "armor": _uuid(rng), "remaining": 200, "spent": 3900},
+                    "ability": {"grenadeEffects": None, "ability1Effects": None, "ability2Effects": None, "ultimateEffects": None},
+                    "wasAfk": False,
+                    "wasPenalized": False,
+                    "stayedInSpawn": False,
+                }
+                for puuid in puuids
+            ],
+            "playerEconomies": [
+                {"subject": puuid, "loadoutValue": 3900, "weapon": _uuid(rng), "armor": _uuid(rng), "remaining": 200, "spent": 3900}
+                for puuid in puuids
+            ],
+            "playerScores": [{"subject": puuid, "score": rng.randint(0, 1000)} for puuid in puuids],
+        })
+
+    return {
+        "matchInfo": {
+            "matchId": match_id,
+            "mapId": rng.choice(MAPS),
+            "gamePodId": "aresriot.aws-rclusterprod-use1-1.na-gp-ashburn-1",
+            "gameLoopZone": "na",
+            "gameServerAddress": "1.2.3.4",
+            "gameVersion": "release-06.00-shipping-12-840845",
+            "gameLengthMillis": rounds * 100000,
+            "gameStartMillis": 1672531200000 + seed,
+            "provisioningFlowID": "Matchmaking",
+            "isCompleted": True,
+            "customGameName": "",
+            "forcePostProcessing": False,
+            "queueID": "competitive",
+            "gameMode": "/Game/GameModes/Bomb/BombGameMode.BombGameMode_C",
+            "isRanked": True,
+            "isMatchSampled": False,
+            "seasonId": _uuid(rng),
+            "completionState": "Completed",
+            "platformType": "PC",
+            "partyRRPenalties": {_uuid(rng): 0},
+            "shouldMatchDisablePenalties": False,
+        },
+        "players": [
+            {
+                "subject": puuid,
+                "gameName": f"Player{index}",
+                "tagLine": f"{index:04d}",
+                "platformInfo": {"platformType": "PC", "platformOS": "Windows", "platformOSVersion": "10.0", "platformChipset": "Unknown"},
+                "teamId": teams[puuid],
+                "partyId": _uuid(rng),
+                "characterId": _uuid(rng),
+                "stats": {"score": rng.randint(1000, 8000), "roundsPlayed": rounds, "kills": 10, "deaths": 10, "assists": 3, "playtimeMillis": 2000000},
+                "roundDamage": [{"round": r, "receiver": rng.choice(puuids), "damage": rng.randint(0, 150)} for r in range(rounds)],
+                "competitiveTier": rng.randint(3, 27),
+                "isObserver": False,
+                "playerCard": _uuid(rng),
+                "playerTitle": _uuid(rng),
+                "preferredLevelBorder": _uuid(rng),
+                "accountLevel": rng.randint(1, 400),
+                "sessionPlaytimeMinutes": rng.randint(0, 300),
+                "xpModifications": [{"Value": 1.0, "ID": "Modifier"}],
+                "behaviorFactors": {"afkRounds": 0, "collisions": 0.0, "damageParticipationOutgoing": 2000, "friendlyFireIncoming": 0, "friendlyFireOutgoing": 0, "stayedInSpawnRounds": 0},
+                "newPlayerExperienceDetails": {"basicMovement": {"idleTimeMillis": 0, "objectiveCompleteTimeMillis": 0}},
+            }
+            for index, puuid in enumerate(puuids)
+        ],
+        "bots": [],
+        "coaches": [],
+        "teams": [
+            {"teamId": "Red", "won": True, "roundsPlayed": rounds, "roundsWon": 13, "numPoints": 13},
+            {"teamId": "Blue", "won": False, "roundsPlayed": rounds, "roundsWon": rounds - 13, "numPoints": rounds - 13},
+        ],
+        "roundResults": round_results,
+        "kills": kills,
+    }
+
+
+def match_history(seed: int = 0, start: int = 0, size: int = 25, total: int = 200) -> Dict:
+    rng = random.Random(seed)
+    return {
+        "Subject": _uuid(rng),
+        "BeginIndex": start,
+        "EndIndex": start + size,
+        "Total": total,
+        "History": [
+            {"MatchID": _uuid(rng), "GameStartTime": 1672531200000 - index * 3600000, "QueueID": "competitive"}
+            for index in range(start, min(start + size, total))
+        ],
+    }
+
+
+def _player_identity(rng: random.Random, puuid: str) -> Dict:
+    return {
+        "Subject": puuid,
+        "PlayerCardID": _uuid(rng),
+        "PlayerTitleID": _uuid(rng),
+        "AccountLevel": rng.randint(1, 400),
+        "PreferredLevelBorderID": _uuid(rng),
+        "Incognito": False,
+        "HideAccountLevel": False,
+    }
+
+
+def _seasonal_badge_info(rng: random.Random) -> Dict:
+    return {"SeasonID": _uuid(rng), "NumberOfWins": rng.randint(0, 100), "WinsByTier": None, "Rank": rng.randint(0, 27), "LeaderboardRank": 0}
+
+
+def core_game_details(seed: int = 0, players: int = 10) -> Dict:
+    rng = random.Random(seed)
+    puuids = [_uuid(rng) for _ in range(players)]
+    return {
+        "MatchID": _uuid(rng),
+        "Version": 1672531200000,
+        "State": "IN_PROGRESS",
+        "MapID": rng.choice(MAPS),
+        "ModeID": "/Game/GameModes/Bomb/BombGameMode.BombGameMode_C",
+        "ProvisioningFlow": "Matchmaking",
+        "GamePodID": "aresriot.aws-rclusterprod-use1-1.na-gp-ashburn-1",
+        "AllMUCName": _uuid(rng),
+        "TeamMUCName": _uuid(rng),
+        "TeamVoiceID": _uuid(rng),
+        "IsReconnectable": True,
+        "ConnectionDetails": {
+            "GameServerHosts": ["1.2.3.4"],
+            "GameServerHost": "1.2.3.4",
+            "GameServerPort": 7000,
+            "GameServerObfuscatedIP": rng.getrandbits(32),
+            "GameClientHash": rng.getrandbits(32),
+            "PlayerKey": _uuid(rng),
+        },
+        "PostGameDetails": None,
+        "Players": [
+            {
+                "Subject": puuid,
+                "TeamID": "Blue" if index % 2 else "Red",
+                "CharacterID": _uuid(rng),
+                "PlayerIdentity": _player_identity(rng, puuid),
+                "SeasonalBadgeInfo": _seasonal_badge_info(rng),
+                "IsCoach": False,
+                "IsAssociated": True,
+            }
+            for index, puuid in enumerate(puuids)
+        ],
+        "MatchmakingData": {"QueueID": "competitive", "IsRanked": True},
+    }
+
+
+def pre_game_details(seed: int = 0, players: int = 5) -> Dict:
+    rng = random.Random(seed)
+    team = {
+        "TeamID": "Red",
+        "Players": [
+            {
+                "Subject": puuid,
+                "CharacterID": _uuid(rng),
+                "CharacterSelectionState": "locked",
+                "PregamePlayerState": "joined",
+                "CompetitiveTier": rng.randint(3, 27),
+                "PlayerIdentity": _player_identity(rng, puuid),
+                "SeasonalBadgeInfo": _seasonal_badge_info(rng),
+                "IsCaptain": False,
+            }
+            for puuid in (_uuid(rng) for _ in range(players))
+        ],
+    }
+    return {
+        "ID": _uuid(rng),
+        "Version": 1672531200000,
+        "Teams": [team],
+        "AllyTeam": team,
+        "EnemyTeam": None,
+        "ObserverSubjects": [],
+        "MatchCoaches": [],
+        "EnemyTeamSize": players,
+        "EnemyTeamLockCount": 0,
+        "PregameState": "character_select_active",
+        "LastUpdated": "2023-01-01T00:00:00Z",
+        "MapID": rng.choice(MAPS),
+        "MapSelectPool": [],
+        "BannedMapIDs": [],
+        "CastedVotes": {},
+        "MapSelectSteps": [],
+        "MapSelectStep": 0,
+        "Team1": "Red",
+        "GamePodID": "aresriot.aws-rclusterprod-use1-1.na-gp-ashburn-1",
+        "Mode": "/Game/GameModes/Bomb/BombGameMode.BombGameMode_C",
+        "VoiceSessionID": _uuid(rng),
+        "MUCName": _uuid(rng),
+        "QueueID": "competitive",
+        "ProvisioningFlowID": "Matchmaking",
+        "IsRanked": True,
+        "PhaseTimeRemainingNS": 75000000000,
+        "StepTimeRemainingNS": 0,
+        "altModesFlagADA": False,
+        "TournamentMetadata": None,
+        "RosterMetadata": None,
+    }
+
+
+def core_game_loadouts(seed: int = 0, players: int = 10) -> Dict:
+    rng = random.Random(seed)
+
+    def item() -> Dict:
+        item_id = _uuid(rng)
+        sockets = {
+            _uuid(rng): {"ID": _uuid(rng), "Item": {"ID": _uuid(rng), "TypeID": _uuid(rng)}}
+            for _ in range(3)
+        }
+        return item_id, {"ID": item_id, "TypeID": _uuid(rng), "Sockets": sockets}
+
+    return {
+        "Loadouts": [
+            {
+                "CharacterID": _uuid(rng),
+                "Loadout": {
+                    "Sprays": {
+                        "SpraySelections": [
+                            {"SocketID": _uuid(rng), "SprayID": _uuid(rng), "LevelID": _uuid(rng)} for _ in range(3)
+                        ]
+                    },
+                    "Items": dict(item() for _ in range(18)),
+                },
+            }
+            for _ in range(players)
+        ],
+    }
+
+
+def leaderboard(seed: int = 0, start: int = 0, size: int = 200, total: int = 15000) -> Dict:
+    """One MMR_FetchLeaderboard page."""
+    rng = random.Random(seed + start)
+    return {
+        "Deployment": "na-prod",
+        "QueueID": "competitive",
+        "SeasonID": _uuid(rng),
+        "Players": [
+            {
+                "PlayerCardID": _uuid(rng),
+                "TitleID": _uuid(rng),
+                "IsBanned": False,
+                "IsAnonymized": rng.random() < 0.2,
+                "puuid": _uuid(rng),
+                "gameName": f"Player{rank}",
+                "tagLine": f"{rank % 10000:04d}",
+                "leaderboardRank": rank,
+                "rankedRating": max(0, 1200 - rank // 10),
+                "numberOfWins": rng.randint(50, 400),
+                "competitiveTier": 27 if rank <= 500 else 26 if rank <= 2000 else 25,
+            }
+            for rank in range(start + 1, min(start + size, total) + 1)
+        ],
+        "totalPlayers": total,
+        "immortalStartingPage": 5,
+        "immortalStartingIndex": 2000,
+        "topTierRRThreshold": 550,
+        "tierDetails": {str(tier): {"rankedRatingThreshold": 0, "startingPage": 0, "startingIndex": 0} for tier in (24, 25, 26, 27)},
+        "startIndex": start,
+        "query": "",
+    }
@@ -0,0 +1,98 @@
+# A local aiohttp stand-in for the game's endpoints, serving the payloads.py fixtures,
+# and a session that sends the client's https://<host>/<path> requests to it.
+import asyncio
+import json
+import re
+from typing import List, Optional, Tuple
+
+import aiohttp
+from aiohttp import web
+
+import payloads
+
+PUUID = "00000000-0000-4000-8000-000000000000"
+MATCH_ID = "11111111-1111-4111-8111-111111111111"
+
+
+def _body(data) -> bytes:
+    return json.dumps(data).encode()
+
+
+def routes() -> List[Tuple[re.Pattern, bytes]]:
+    """(path pattern, json body) pairs, the first match answers. Bodies are encoded once."""
+    return [
+        (re.compile(r"/match-details/v1/matches/"), _body(payloads.match_details())),
+        (re.compile(r"/match-history/v1/history/"), _body(payloads.match_history())),
+        (re.compile(r"/core-game/v1/matches/[^/]+/loadouts"), _body(payloads.core_game_loadouts())),
+        (re.compile(r"/core-game/v1/matches/"), _body(payloads.core_game_details())),
+        (re.compile(r"/pregame/v1/matches/"), _body(payloads.pre_game_details())),
+        (re.compile(r"/(core-game|pregame)/v1/players/"), _body({"Subject": PUUID, "MatchID": MATCH_ID, "Version": 1})),
+        (re.compile(r"/mmr/v1/leaderboards/"), _body(payloads.leaderboard())),
+        (re.compile(r"/name-service/v2/players"), _body([{"Subject": PUUID, "GameName": "Player", "TagLine": "0000"}])),
+        (re.compile(r"/userinfo"), _body({"sub": PUUID})),
+    ]
+
+
+class StandInServer:
+    def __init__(self, port: int = 0, latency: float = 0.0):
+        """
+        Answers every request with the fixture of the first matching route, `{}` otherwise,
+        after `latency` seconds. port 0 picks a free one, see `port` once started.
+        """
+        self.port = port
+        self.latency = latency
+        self.routes = routes()
+        self._runner: Optional[web.AppRunner] = None
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        for pattern, body in self.routes:
+            if pattern.search(request.path):
+                return web.Response(body=body, content_type="application/json")
+        return web.Response(body=b"{}", content_type="application/json")
+
+    async def start(self) -> "StandInServer":
+        app = web.Application()
+        app.router.add_route("*", "/{tail:.*}", self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", self.port)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+        return self
+
+    async def close(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    async def __aenter__(self) -> "StandInServer":
+        return await self.start()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+
+class LocalSession:
+    """
+    Wraps an aiohttp session: https://<host>/<path> is sent to http://127.0.0.1:<port>/<host>/<path>.
+    Pass it in Client(session=...). The last rewritten (method, url) is kept in `last`.
+    """
+    def __init__(self, port: int, **session_kwargs):
+        self.port = port
+        self.session = aiohttp.ClientSession(**session_kwargs)
+        self.last: Optional[Tuple[str, str]] = None
+
+    def rewrite(self, url) -> str:
+        return re.sub(r"^https://([^/]+)", lambda match: f"http://127.0.0.1:{self.port}/{match.group(1)}", str(url))
+
+    def request(self, method: str, url, **kwargs):
+        url = self.rewrite(url)
+        self.last = (method, url)
+        return self.session.request(method, url, **kwargs)
+
+    def __getattr__(self, name: str):
+        return getattr(self.session, name)
+
+    async def close(self) -> None:
+        await self.session.close()
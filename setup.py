@@ -30,5 +30,9 @@ setup(
                     'dataclass_wizard==0.22.2',
                     'requests==2.28.2',
                     'setuptools==65.5.0'
-                    ]
+                    ],
+    extras_require={
+        "analytics": ["numpy>=1.20"],
+        "fast": ["orjson>=3.6"],
+    },
 )
\ No newline at end of file
@@ -0,0 +1,264 @@
+# Columnar (struct-of-arrays) view of kills & round stats of many matches.
+# Requires numpy: pip install valorantClientAPI[analytics]
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+def require_numpy():
+    if np is None:
+        raise ImportError("numpy is required for analytics, install it with: pip install valorantClientAPI[analytics]")
+    return np
+
+
+def _field(obj, name: str, key: str, default=None):
+    """
+    Reads a field from a MatchDetails dataclass or from the raw match details json.
+    Missing & None values (Optional dataclass fields, json nulls) both give `default`.
+    """
+    value = obj.get(key) if isinstance(obj, dict) else getattr(obj, name, None)
+    return default if value is None else value
+
+
+def _raw_or_model(match):
+    # LazyMatchDetails keeps the json, reading it directly avoids building the dataclasses
+    raw = getattr(match, "raw", None)
+    return raw if isinstance(raw, dict) else match
+
+
+class _Codes:
+    """Dictionary encoding of strings to int32 codes."""
+    def __init__(self):
+        self.index: Dict[str, int] = {}
+        self.values: List[str] = []
+
+    def __call__(self, value) -> int:
+        if value is None or value == "":
+            return -1
+        code = self.index.get(value)
+        if code is None:
+            code = self.index[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+@dataclass
+class MatchColumns:
+    """
+    Kills & per-round player stats as typed numpy arrays.
+    Players, matches, maps, queues, damage items, agents and teams are dictionary encoded: e.g. `killer`
+    holds indices into `puuids`, -1 where there is none. match_map & match_queue index `map_ids` &
+    `queue_ids` per match.
+    Kill arrays: match, round, game_time, round_time, killer, victim, victim_x, victim_y,
+    killer_x, killer_y, killer_view, damage_item, assists.
+    assist_kill & assist_player hold one row per assist (the kill's index & the assistant).
+    Round stat arrays (one row per player per round): stat_match, stat_round, stat_player,
+    score, damage, headshots, bodyshots, legshots, loadout_value, spent, remaining.
+    Location arrays (one row per player position at a kill): kill, player, x, y, view.
+    Roster arrays (one row per player per match): match, player, agent (index into agent_ids),
+    team (index into team_ids).
+    Round arrays (one row per round): match, round, plant_time (-1 if not planted),
+    winning_team (index into team_ids).
+    """
+    puuids: List[str]
+    match_ids: List[str]
+    map_ids: List[str]
+    queue_ids: List[str]
+    damage_items: List[str]
+    agent_ids: List[str]
+    team_ids: List[str]
+    match_map: Any
+    match_queue: Any
+    kills: Dict[str, Any]
+    assist_kill: Any
+    assist_player: Any
+    stats: Dict[str, Any]
+    locations: Dict[str, Any]
+    roster: Dict[str, Any]
+    rounds: Dict[str, Any]
+
+    @classmethod
+    def from_matches(cls, matches: Iterable) -> "MatchColumns":
+        """Builds the columns of MatchDetails, LazyMatchDetails or raw match details json."""
+        np = require_numpy()
+        players, match_codes, map_codes, queue_codes, item_codes = _Codes(), _Codes(), _Codes(), _Codes(), _Codes()
+        agent_codes, team_codes = _Codes(), _Codes()
+        match_map, match_queue = [], []
+        kills = {name: [] for name in (
+            "match", "round", "game_time", "round_time", "killer", "victim", "victim_x", "victim_y",
+            "killer_x", "killer_y", "killer_view", "damage_item", "assists",
+        )}
+        assist_kill, assist_player = [], []
+        stats = {name: [] for name in (
+            "stat_match", "stat_round", "stat_player", "score", "damage", "headshots", "bodyshots", "legshots",
+            "loadout_value", "spent", "remaining",
+        )}
+        locations = {name: [] for name in ("kill", "player", "x", "y", "view")}
+        roster = {name: [] for name in ("match", "player", "agent", "team")}
+        rounds = {name: [] for name in ("match", "round", "plant_time", "winning_team")}
+        nan = float("nan")
+
+        for match in matches:
+            match = _raw_or_model(match)
+            info = _field(match, "match_info", "matchInfo")
+            match_code = match_codes(_field(info, "match_id", "matchId"))
+            match_map.append(map_codes(_field(info, "map_id", "mapId")))
+            match_queue.append(queue_codes(_field(info, "queue_id", "queueID")))
+
+            for player in _field(match, "players", "players") or ():
+                roster["match"].append(match_code)
+                roster["player"].append(players(_field(player, "subject", "subject")))
+                roster["agent"].append(agent_codes(_field(player, "character_id", "characterId")))
+                roster["team"].append(team_codes(_field(player, "team_id", "teamId")))
+
+            for kill in _field(match, "kills", "kills") or ():
+                killer = _field(kill, "killer", "killer")
+                killer_location = None
+                killer_view = nan
+                kill_index = len(kills["match"])
+                for location in _field(kill, "player_locations", "playerLocations") or ():
+                    subject = _field(location, "subject", "subject")
+                    point = _field(location, "location", "location") or {}
+                    view = _field(location, "view_radians", "viewRadians", nan)
+                    locations["kill"].append(kill_index)
+                    locations["player"].append(players(subject))
+                    locations["x"].append(point.get("x", nan))
+                    locations["y"].append(point.get("y", nan))
+                    locations["view"].append(view)
+                    if subject == killer:
+                        killer_location = point
+                        killer_view = view
+                victim_location = _field(kill, "victim_location", "victimLocation") or {}
+                damage = _field(kill, "finishing_damage", "finishingDamage") or {}
+                assistants = _field(kill, "assistants", "assistants") or ()
+
+                kills["match"].append(match_code)
+                kills["round"].append(_field(kill, "round", "round", -1))
+                kills["game_time"].append(_field(kill, "game_time", "gameTime", 0))
+                kills["round_time"].append(_field(kill, "round_time", "roundTime", 0))
+                kills["killer"].append(players(killer))
+                kills["victim"].append(players(_field(kill, "victim", "victim")))
+                kills["victim_x"].append(victim_location.get("x", nan))
+                kills["victim_y"].append(victim_location.get("y", nan))
+                kills["killer_x"].append(killer_location["x"] if killer_location else nan)
+                kills["killer_y"].append(killer_location["y"] if killer_location else nan)
+                kills["killer_view"].append(killer_view)
+                kills["damage_item"].append(item_codes(damage.get("damageItem")))
+                kills["assists"].append(len(assistants))
+                for assistant in assistants:
+                    assist_kill.append(kill_index)
+                    assist_player.append(players(assistant))
+
+            for result in _field(match, "round_results", "roundResults") or ():
+                round_num = _field(result, "round_num", "roundNum", -1)
+                planted = _field(result, "bomb_planter", "bombPlanter")
+                rounds["match"].append(match_code)
+                rounds["round"].append(round_num)
+                rounds["plant_time"].append(_field(result, "plant_round_time", "plantRoundTime", 0) if planted else -1)
+                rounds["winning_team"].append(team_codes(_field(result, "winning_team", "winningTeam")))
+                for stat in _field(result, "player_stats", "playerStats") or ():
+                    damage = _field(stat, "damage", "damage") or ()
+                    economy = _field(stat, "economy", "economy") or {}
+                    stats["stat_match"].append(match_code)
+                    stats["stat_round"].append(round_num)
+                    stats["stat_player"].append(players(_field(stat, "subject", "subject")))
+                    stats["score"].append(_field(stat, "score", "score", 0))
+                    stats["damage"].append(sum(hit.get("damage", 0) for hit in damage))
+                    stats["headshots"].append(sum(hit.get("headshots", 0) for hit in damage))
+                    stats["bodyshots"].append(sum(hit.get("bodyshots", 0) for hit in damage))
+                    stats["legshots"].append(sum(hit.get("legshots", 0) for hit in damage))
+                    stats["loadout_value"].append(economy.get("loadoutValue", 0))
+                    stats["spent"].append(economy.get("spent", 0))
+                    stats["remaining"].append(economy.get("remaining", 0))
+
+        kill_types = {
+            "match": np.int32, "round": np.int16, "game_time": np.int64, "round_time": np.int64,
+            "killer": np.int32, "victim": np.int32, "victim_x": np.float32, "victim_y": np.float32,
+            "killer_x": np.float32, "killer_y": np.float32, "killer_view": np.float32,
+            "damage_item": np.int32, "assists": np.int8,
+        }
+        stat_types = {
+            "stat_match": np.int32, "stat_round": np.int16, "stat_player": np.int32, "score": np.int32,
+            "damage": np.int32, "headshots": np.int32, "bodyshots": np.int32, "legshots": np.int32,
+            "loadout_value": np.int32, "spent": np.int32, "remaining": np.int32,
+        }
+        return cls(
+            puuids=players.values,
+            match_ids=match_codes.values,
+            map_ids=map_codes.values,
+            queue_ids=queue_codes.values,
+            damage_items=item_codes.values,
+            agent_ids=agent_codes.values,
+            team_ids=team_codes.values,
+            match_map=np.asarray(match_map, dtype=np.int32),
+            match_queue=np.asarray(match_queue, dtype=np.int32),
+            kills={name: np.asarray(values, dtype=kill_types[name]) for name, values in kills.items()},
+            assist_kill=np.asarray(assist_kill, dtype=np.int64),
+            assist_player=np.asarray(assist_player, dtype=np.int32),
+            stats={name: np.asarray(values, dtype=stat_types[name]) for name, values in stats.items()},
+            locations={
+                "kill": np.asarray(locations["kill"], dtype=np.int64),
+                "player": np.asarray(locations["player"], dtype=np.int32),
+                "x": np.asarray(locations["x"], dtype=np.float32),
+                "y": np.asarray(locations["y"], dtype=np.float32),
+                "view": np.asarray(locations["view"], dtype=np.float32),
+            },
+            roster={name: np.asarray(values, dtype=np.int32) for name, values in roster.items()},
+            rounds={
+                "match": np.asarray(rounds["match"], dtype=np.int32),
+                "round": np.asarray(rounds["round"], dtype=np.int16),
+                "plant_time": np.asarray(rounds["plant_time"], dtype=np.int64),
+                "winning_team": np.asarray(rounds["winning_team"], dtype=np.int32),
+            },
+        )
+
+    def first_kills(self):
+        """Boolean mask of the kills that were the first of their round."""
+        if len(self.kills["match"]) == 0:
+            return np.zeros(0, dtype=bool)
+        order = np.lexsort((self.kills["round_time"], self.kills["round"], self.kills["match"]))
+        match = self.kills["match"][order]
+        round_ = self.kills["round"][order]
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = (match[1:] != match[:-1]) | (round_[1:] != round_[:-1])
+        mask = np.zeros(len(order), dtype=bool)
+        mask[order] = first
+        return mask
+
+    def player_stats(self) -> Dict[str, Any]:
+        """Per player totals, each array indexed like `puuids`."""
+        players = len(self.puuids)
+        killer, victim = self.kills["killer"], self.kills["victim"]
+        first = self.first_kills()
+        kills = np.bincount(killer[killer >= 0], minlength=players)
+        deaths = np.bincount(victim[victim >= 0], minlength=players)
+        assists = np.bincount(self.assist_player[self.assist_player >= 0], minlength=players)
+        rounds = np.bincount(self.stats["stat_player"], minlength=players)
+        damage = np.bincount(self.stats["stat_player"], weights=self.stats["damage"], minlength=players)
+        score = np.bincount(self.stats["stat_player"], weights=self.stats["score"], minlength=players)
+        headshots = np.bincount(self.stats["stat_player"], weights=self.stats["headshots"], minlength=players)
+        shots = headshots + np.bincount(
+            self.stats["stat_player"], weights=self.stats["bodyshots"] + self.stats["legshots"], minlength=players
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return {
+                "kills": kills,
+                "deaths": deaths,
+                "assists": assists,
+                "kda": (kills + assists) / np.maximum(deaths, 1),
+                "first_kills": np.bincount(killer[first & (killer >= 0)], minlength=players),
+                "first_deaths": np.bincount(victim[first & (victim >= 0)], minlength=players),
+                "rounds": rounds,
+                "damage_per_round": damage / np.maximum(rounds, 1),
+                "score_per_round": score / np.maximum(rounds, 1),
+                "headshot_rate": np.where(shots > 0, headshots / shots, 0.0),
+            }
+
+
+def to_columns(matches: Iterable) -> MatchColumns:
+    """Builds the columns of many MatchDetails, LazyMatchDetails or raw match details json."""
+    return MatchColumns.from_matches(matches)
@@ -0,0 +1,204 @@
+# Positional heatmaps: death, kill & player positions binned into fixed grids per map.
+# Requires numpy: pip install valorantClientAPI[analytics]
+import json
+from typing import Dict, Iterable, Optional, Tuple
+
+from .columns import MatchColumns, require_numpy, to_columns
+
+POINTS = ("deaths", "kills", "positions")
+SPLITS = (None, "agent", "side", "phase")
+DEFAULT_EXTENT = (-15000.0, 15000.0, -15000.0, 15000.0)
+ROUNDS_PER_HALF = 12
+# Rounds per half of the queues whose sides are known, points of other queues can't be split by side
+HALF_LENGTHS = {
+    "competitive": ROUNDS_PER_HALF,
+    "unrated": ROUNDS_PER_HALF,
+    "premier": ROUNDS_PER_HALF,
+    "custom": ROUNDS_PER_HALF,
+    "swiftplay": 4,
+    "spikerush": 3,
+}
+
+
+def _lookup(np, table_keys, table_values, keys):
+    """Vectorized dict lookup of int64 keys, -1 where a key isn't in the table."""
+    if len(table_keys) == 0:
+        return np.full(len(keys), -1, dtype=np.int64)
+    order = np.argsort(table_keys, kind="stable")
+    sorted_keys = table_keys[order]
+    index = np.minimum(np.searchsorted(sorted_keys, keys), len(sorted_keys) - 1)
+    found = sorted_keys[index] == keys
+    return np.where(found, table_values[order][index], -1)
+
+
+class Heatmap:
+    def __init__(self, points: str = "deaths", split: Optional[str] = None, bins: int = 128,
+                 extent: Tuple[float, float, float, float] = DEFAULT_EXTENT,
+                 extents: Optional[Dict[str, Tuple[float, float, float, float]]] = None):
+        """
+        Counts positions in a `bins` x `bins` grid per map_id, and per group when split.
+        points: "deaths" (victim locations), "kills" (the killer's location at each kill)
+        or "positions" (every player's location at every kill).
+        split: None, "agent" (character id), "side" ("attack"/"defense") or
+        "phase" ("pre_plant"/"post_plant").
+        extent is the (x_min, x_max, y_min, y_max) area of the grid in game units,
+        `extents` overrides it per map_id. Points outside of it are dropped, as are
+        points that can't be put in a group: sides are only known in the queues of
+        HALF_LENGTHS (so not in e.g. deathmatch), and not in the decider rounds of
+        swiftplay & spike rush.
+        """
+        if points not in POINTS:
+            raise ValueError(f"points must be one of {POINTS}")
+        if split not in SPLITS:
+            raise ValueError(f"split must be one of {SPLITS}")
+        self.points = points
+        self.split = split
+        self.bins = bins
+        self.extent = tuple(extent)
+        self.extents = {map_id: tuple(value) for map_id, value in (extents or {}).items()}
+        # (map_id, group) -> int64 counts, grid[i, j] counts the points in x bin i & y bin j
+        self.grids: Dict[Tuple[str, str], object] = {}
+
+    def extent_of(self, map_id: str) -> Tuple[float, float, float, float]:
+        return self.extents.get(map_id, self.extent)
+
+    def edges(self, map_id: str):
+        """x & y bin edges of a map's grids."""
+        np = require_numpy()
+        x_min, x_max, y_min, y_max = self.extent_of(map_id)
+        return np.linspace(x_min, x_max, self.bins + 1), np.linspace(y_min, y_max, self.bins + 1)
+
+    def grid(self, map_id: str, group: str = ""):
+        """Counts of a map (& group), zeros when nothing was added for it."""
+        np = require_numpy()
+        grid = self.grids.get((map_id, group))
+        return grid if grid is not None else np.zeros((self.bins, self.bins), dtype=np.int64)
+
+    def groups(self, map_id: str):
+        return sorted(group for grid_map, group in self.grids if grid_map == map_id)
+
+    def add(self, matches: Iterable) -> "Heatmap":
+        """Adds MatchDetails, LazyMatchDetails or raw match details json."""
+        return self.add_columns(to_columns(matches))
+
+    def add_columns(self, columns: MatchColumns) -> "Heatmap":
+        """Adds the positions of already built MatchColumns."""
+        np = require_numpy()
+        kills = columns.kills
+        if self.points == "positions":
+            kill = columns.locations["kill"]
+            x, y, player = columns.locations["x"], columns.locations["y"], columns.locations["player"]
+        elif self.points == "kills":
+            kill = np.arange(len(kills["match"]))
+            x, y, player = kills["killer_x"], kills["killer_y"], kills["killer"]
+        else:
+            kill = np.arange(len(kills["match"]))
+            x, y, player = kills["victim_x"], kills["victim_y"], kills["victim"]
+
+        keep = ~(np.isnan(x) | np.isnan(y))
+        kill, x, y, player = kill[keep], x[keep], y[keep], player[keep]
+        match = kills["match"][kill].astype(np.int64)
+        map_code = columns.match_map[match].astype(np.int64)
+        group, names = self._groups(np, columns, kill, match, player)
+        keep = (map_code >= 0) & (group >= 0)
+        x, y, map_code, group = x[keep], y[keep], map_code[keep], group[keep]
+
+        # One histogram per (map, group): sort the points by it and histogram each slice
+        combo = map_code * max(len(names), 1) + group
+        order = np.argsort(combo, kind="stable")
+        combo, x, y = combo[order], x[order], y[order]
+        unique, starts = np.unique(combo, return_index=True)
+        ends = np.append(starts[1:], len(combo))
+        for value, start, end in zip(unique.tolist(), starts.tolist(), ends.tolist()):
+            map_id = columns.map_ids[value // max(len(names), 1)]
+            key = (map_id, names[value % max(len(names), 1)])
+            x_min, x_max, y_min, y_max = self.extent_of(map_id)
+            counts, _, _ = np.histogram2d(
+                x[start:end], y[start:end], bins=self.bins, range=((x_min, x_max), (y_min, y_max))
+            )
+            grid = self.grids.get(key)
+            if grid is None:
+                self.grids[key] = counts.astype(np.int64)
+            else:
+                grid += counts.astype(np.int64)
+        return self
+
+    def _groups(self, np, columns: MatchColumns, kill, match, player):
+        """Group code of each point & the group names."""
+        if self.split is None:
+            return np.zeros(len(kill), dtype=np.int64), [""]
+
+        if self.split == "phase":
+            rounds = columns.rounds
+            round_key = rounds["match"].astype(np.int64) * 65536 + rounds["round"]
+            point_round = columns.kills["round"][kill].astype(np.int64)
+            plant_time = _lookup(np, round_key, rounds["plant_time"], match * 65536 + point_round)
+            post_plant = (plant_time >= 0) & (columns.kills["round_time"][kill] >= plant_time)
+            return post_plant.astype(np.int64), ["pre_plant", "post_plant"]
+
+        roster = columns.roster
+        width = len(columns.puuids) + 1
+        roster_key = roster["match"].astype(np.int64) * width + roster["player"]
+        point_key = match * width + player
+        if self.split == "agent":
+            return _lookup(np, roster_key, roster["agent"], point_key), list(columns.agent_ids)
+
+        team = _lookup(np, roster_key, roster["team"], point_key)
+        team_ids = np.asarray(columns.team_ids + [""], dtype=object)
+        team_name = team_ids[team]
+        # Half length of each point's match, 0 for queues without sides (match_queue -1 reads the extra 0)
+        halves = np.asarray([HALF_LENGTHS.get(queue, 0) for queue in columns.queue_ids] + [0], dtype=np.int64)
+        half = halves[columns.match_queue[match]]
+        point_round = columns.kills["round"][kill].astype(np.int64)
+        # Red attacks the first half, sides swap at the half & every overtime round.
+        # The decider rounds of shortened modes (half < 12) are left unknown.
+        first_half = point_round < half
+        second_half = (point_round >= half) & (point_round < half * 2)
+        overtime = (point_round >= half * 2) & (half == ROUNDS_PER_HALF)
+        red_attacks = first_half | (overtime & ((point_round - half * 2) % 2 == 0))
+        attacking = np.where(red_attacks, "Red", "Blue") == team_name
+        known = (
+            (team >= 0) & np.isin(team_name, ("Red", "Blue")) & (point_round >= 0) & (half > 0)
+            & (first_half | second_half | overtime)
+        )
+        return np.where(known, np.where(attacking, 0, 1), -1), ["attack", "defense"]
+
+    def merge(self, other: "Heatmap") -> "Heatmap":
+        """Adds the counts of another heatmap with the same settings to this one."""
+        if (other.points, other.split, other.bins) != (self.points, self.split, self.bins):
+            raise ValueError("can only merge heatmaps with the same points, split & bins")
+        for key, counts in other.grids.items():
+            if other.extent_of(key[0]) != self.extent_of(key[0]):
+                raise ValueError(f"{key[0]} has a different extent")
+            grid = self.grids.get(key)
+            if grid is None:
+                self.grids[key] = counts.copy()
+            else:
+                grid += counts
+        return self
+
+    def save(self, file) -> None:
+        """Writes the heatmap to a path or file object as a compressed .npz."""
+        np = require_numpy()
+        keys = list(self.grids)
+        meta = {
+            "points": self.points,
+            "split": self.split,
+            "bins": self.bins,
+            "extent": self.extent,
+            "extents": self.extents,
+            "keys": keys,
+        }
+        arrays = {f"grid_{index}": self.grids[key] for index, key in enumerate(keys)}
+        np.savez_compressed(file, meta=np.asarray(json.dumps(meta)), **arrays)
+
+    @classmethod
+    def load(cls, file) -> "Heatmap":
+        """Reads a heatmap written by save()."""
+        np = require_numpy()
+        with np.load(file) as data:
+            meta = json.loads(str(data["meta"]))
+            heatmap = cls(meta["points"], meta["split"], meta["bins"], meta["extent"], meta["extents"])
+            for index, key in enumerate(meta["keys"]):
+                heatmap.grids[tuple(key)] = data[f"grid_{index}"]
+        return heatmap
@@ -1,19 +1,39 @@
 # Imports
 import aiohttp
-import requests
+import asyncio
 import json
+import os
+import re
+from contextlib import asynccontextmanager
+import time
+from typing import AsyncIterator, Iterable, Dict, Optional, TextIO, Union
+from urllib.parse import urlsplit
 from . import riot_auth
 from .response.core_game import CoreGameDetails, CoreGameMatchLoadout
 from .response.pre_game import PreGameDetails
-from .response.mmr import MatchHistory, MatchDetails
+from .response.mmr import MatchHistory, MatchDetails, History, LazyMatchDetails
 from .response.errors import httpStatusError
-from dataclass_wizard import fromdict
-from .utils.limiter import Limiter
+from .utils.decoder import decode
+from .utils.limiter import RateLimiter, host_family
+from .utils.retry import RetryPolicy, RETRY_STATUSES, parse_retry_after
+from .utils import jsonlib, version
+from .utils.batch import BatchResult, stream, paged
+from .utils.sinks import open_sink
+from .utils.names import NameResolver
+from .utils.cache import ResponseCache, CacheEntry
+from .utils.store import MatchStore
+from .utils.metrics import Metrics, current_call, instrumented
+from .utils.tracing import Tracer
+from .live import PlayerWatcher, LiveMatchBundle
 from dataclass_wizard.errors import ParseError
 
 
 # Variables
 regions = ["na", "eu", "latam", "br", "ap", "kr", "pbe"]
+RESPONSE_MODES = ("model", "dict", "bytes")
+WARMUP_FAMILIES = ("pd", "glz", "shared")
+# Only a completed match has this in its matchInfo, lets raw bodies be stored without decoding them
+MATCH_COMPLETED = re.compile(rb'"isCompleted"\s*:\s*true')
 
 # Custom Exceptions
 class Exceptions:
@@ -23,21 +43,124 @@ class Exceptions:
         """Index out of range."""
     class InvalidQueueID(Exception):
         """Invalid Queue ID"""
+    class RequestFailed(Exception):
+        """The server returned an error response."""
+    class InvalidResponseMode(Exception):
+        """Invalid response mode"""
 
 async def content_verify(response):
     """
     Helper function to verify response content-type & deal
-    with the response appropriately 
+    with the response appropriately.
+    The body is read once as bytes & decoded with the configured json decoder (see utils/jsonlib.py).
+    Returns None for an empty body or a non-json content-type.
     """
-    content_type = response.headers.get("Content-Type")
-    if content_type == "application/json; charset=utf-8" or content_type == "application/json":
-        return await response.json()
-    elif content_type == "text/plain; charset=utf-8" or content_type == "text/plain":
-        return json.loads(await response.text())
+    if not jsonlib.is_json(response.headers.get("Content-Type")):
+        return None
+    call = current_call.get()
+    if call is None:
+        return jsonlib.decode(await response.read())
+    start = time.perf_counter()
+    body = await response.read()
+    read = time.perf_counter()
+    try:
+        return jsonlib.decode(body)
+    finally:
+        call.network += read - start
+        call.parse += time.perf_counter() - read
+        call.bytes += len(body)
+
+def decode_model(cls, data):
+    """decode(cls, data), timed as parsing when the call is being recorded."""
+    call = current_call.get()
+    if call is None:
+        return decode(cls, data)
+    start = time.perf_counter()
+    try:
+        return decode(cls, data)
+    finally:
+        call.parse += time.perf_counter() - start
+
+async def read_error(response) -> httpStatusError:
+    """
+    The httpStatusError of an error response. A body that isn't a json object
+    (an html 502 page, an empty 404...) keeps the status, reason & body text.
+    """
+    body = await response.read()
+    call = current_call.get()
+    if call is not None:
+        call.bytes += len(body)
+    data = None
+    if jsonlib.is_json(response.headers.get("Content-Type")):
+        try:
+            data = jsonlib.decode(body)
+        except ValueError:
+            pass
+    if isinstance(data, dict):
+        return httpStatusError(
+            httpStatus=data.get("httpStatus", response.status),
+            errorCode=data.get("errorCode", response.reason),
+            message=data.get("message", ""),
+        )
+    return httpStatusError(httpStatus=response.status, errorCode=response.reason, message=body.decode("utf-8", "replace"))
+
+def error_status(result) -> Optional[int]:
+    """The http status of an error response (httpStatusError or error json), None for anything else."""
+    if isinstance(result, httpStatusError):
+        return result.httpStatus
+    if isinstance(result, dict):
+        status = result.get("httpStatus")
+        return status if isinstance(status, int) else None
+    return None
+
+
+def check_response_mode(mode: str) -> None:
+    if mode not in RESPONSE_MODES:
+        raise Exceptions.InvalidResponseMode(f"Invalid response mode. Valid modes: {RESPONSE_MODES}")
+
+async def read_response(response, cls, mode: str = "model"):
+    """
+    Reads the response of a typed endpoint in the given mode:
+    "model" decodes it into `cls`, "dict" returns the decoded json & "bytes" the raw body.
+    Error responses are returned as an httpStatusError in every mode.
+    """
+    if response.status >= 400:
+        return await read_error(response)
+    if mode == "bytes":
+        call = current_call.get()
+        start = time.perf_counter()
+        body = await response.read()
+        if call is not None:
+            call.network += time.perf_counter() - start
+            call.bytes += len(body)
+        return body
+    data = await content_verify(response=response)
+    return data if mode == "dict" else decode_model(cls, data)
 
 class Client:
-    def __init__(self, region: str = "na", client_platform: str = None, entitlements_token: str = None, access_token: str = None):
-        """Initializes the client."""
+    def __init__(self, region: str = "na", client_platform: str = None, entitlements_token: str = None, access_token: str = None,
+                 client_version: str = None, session: aiohttp.ClientSession = None, connection_limit: int = 100,
+                 connection_limit_per_host: int = 30, dns_cache_ttl: int = 300, keepalive_timeout: float = 60,
+                 rate_limiter: RateLimiter = None, retry_policy: RetryPolicy = None, response_cache: ResponseCache = None,
+                 match_store: MatchStore = None, refresh_margin: float = 300, cookie_path: str = None,
+                 metrics: Metrics = None, tracer: Tracer = None):
+        """Initializes the client.
+        All requests share one pooled aiohttp session. Pass in `session` to use your own,
+        otherwise one is created on first use and closed by `close()`.
+        Requests are paced by `rate_limiter`, which can be shared between clients,
+        and throttled or failed requests are retried according to `retry_policy`.
+        Pass in a `response_cache` to cache slow-changing endpoints like Content_FetchContent,
+        and a `match_store` to keep completed match details on disk.
+        After `authorize`, tokens are refreshed with the login cookies `refresh_margin` seconds
+        before they expire. With a `cookie_path` the cookies are kept on disk, so a restarted
+        process can authorize without a full login. The account they belong to is kept next to
+        them in `<cookie_path>.account`, they are only used to authorize that same account.
+        Pass in `metrics` to record counts, statuses, timings & bytes of every endpoint call,
+        and a `tracer` to trace dns, connection & time to first byte of every request
+        (your own `session` needs `trace_configs=[tracer.trace_config()]` for that).
+        Prefer `await Client.create(...)` inside a running event loop, so the client
+        version is resolved without blocking.
+        """
         self.username = None
         self.password = None
         self.puuid = None
@@ -48,7 +171,9 @@ class Client:
             self.shard_region = region.lower()
         self.entitlements_token = entitlements_token
         self.access_token = access_token
-        self.client_version = get_client_version()
+        if client_version is None:
+            client_version = get_client_version()
+        self.client_version = client_version
 
         if client_platform is None:
             self.client_platform = "ew0KCSJwbGF0Zm9ybVR5cGUiOiAiUEMiLA0KCSJwbGF0Zm9ybU9TIjogIldpbmRvd3MiLA0KCSJwbGF0Zm9ybU9TVmVyc2lvbiI6ICIxMC4wLjE5MDQyLjEuMjU2LjY0Yml0IiwNCgkicGxhdGZvcm1DaGlwc2V0IjogIlVua25vd24iDQp9"
@@ -57,41 +182,314 @@ class Client:
 
         if region not in regions:
             raise ValueError("Invalid region.")
+
+        self.connection_limit = connection_limit
+        self.connection_limit_per_host = connection_limit_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self._session = session
+        self._owns_session = session is None
+        self.rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter()
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.names = NameResolver(self)
+        self.response_cache = response_cache
+        self.match_store = match_store
+        self.refresh_margin = refresh_margin
+        self.cookie_path = cookie_path
+        self.expires_at = 0
+        self._auth: riot_auth.RiotAuth = None
+        self._refresh: asyncio.Future = None
+        self._warm_hosts: Dict[str, int] = {}
+        self.metrics = metrics
+        self.tracer = tracer
+        self._health_check: asyncio.Task = None
+
+    @classmethod
+    async def create(cls, *args, **kwargs) -> "Client":
+        """Creates a client, resolving the client version asynchronously.
+        The version is cached process-wide, see `utils.version.configure`.
+        """
+        if kwargs.get("client_version") is None:
+            kwargs["client_version"] = await version.get_client_version_async(kwargs.get("session"))
+        return cls(*args, **kwargs)
+
+    async def __aenter__(self):
+        self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Returns the shared session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.connection_limit,
+                limit_per_host=self.connection_limit_per_host,
+                ttl_dns_cache=self.dns_cache_ttl,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+            trace_configs = [self.tracer.trace_config()] if self.tracer is not None else None
+            self._session = aiohttp.ClientSession(connector=connector, trace_configs=trace_configs)
+            self._owns_session = True
+        return self._session
+
+    async def close(self) -> None:
+        """Closes the shared session and its pooled connections."""
+        if self._health_check is not None:
+            self._health_check.cancel()
+            self._health_check = None
+        if self._session is not None and self._owns_session:
+            await self._session.close()
+            self._session = None
     
+    def family_hosts(self) -> Dict[str, str]:
+        """Host of each host family for the client's region."""
+        return {
+            "pd": f"pd.{self.shard_region}.a.pvp.net",
+            "glz": f"glz-{self.region}-1.{self.shard_region}.a.pvp.net",
+            "shared": f"shared.{self.shard_region}.a.pvp.net",
+            "store": f"store.{self.region}.a.pvp.net",
+        }
+
+    async def warmup(self, hosts: Iterable[str] = WARMUP_FAMILIES, connections: int = 2,
+                     health_check_interval: float = None) -> Dict[str, Optional[float]]:
+        """Resolves DNS and opens `connections` keep-alive connections to each host,
+        so the first requests don't pay for the handshakes.
+        hosts are host families ("pd", "glz", "shared", "store") or host names.
+        With a `health_check_interval` (keep it under `keepalive_timeout`), idle connections
+        are checked in the background and dropped ones are reopened, until `close()`.
+        Returns the seconds each host took, None for hosts that couldn't be reached.
+        """
+        family_hosts = self.family_hosts()
+        connections = max(1, min(connections, self.connection_limit_per_host or connections))
+        hosts = [family_hosts.get(host, host) for host in hosts]
+        for host in hosts:
+            self._warm_hosts[host] = connections
+        timings = await asyncio.gather(*(self._warm(host, connections) for host in hosts))
+        if health_check_interval is not None and self._health_check is None:
+            self._health_check = asyncio.ensure_future(self._check_connections(health_check_interval))
+        return dict(zip(hosts, timings))
+
+    async def _warm(self, host: str, connections: int) -> Optional[float]:
+        """Sends `connections` concurrent requests, which reuse idle connections & open the missing ones."""
+        session = self._get_session()
+
+        async def ping():
+            # GET rather than HEAD, newer aiohttp versions don't keep the connection after a HEAD
+            async with session.request("GET", f"https://{host}/", allow_redirects=False) as resp:
+                await resp.read()
+
+        start = time.monotonic()
+        try:
+            await asyncio.gather(*(ping() for _ in range(connections)))
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return None
+        return time.monotonic() - start
+
+    async def _check_connections(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            await asyncio.gather(*(self._warm(host, connections) for host, connections in self._warm_hosts.items()))
+
+    def pool_stats(self) -> Dict:
+        """Connection limits and the idle & in use connections of every host in the pool."""
+        connector = self._session.connector if self._session is not None and not self._session.closed else None
+        if connector is None:
+            return {"limit": self.connection_limit, "limit_per_host": self.connection_limit_per_host, "hosts": {}}
+        hosts: Dict[str, Dict[str, int]] = {}
+        for key, idle in getattr(connector, "_conns", {}).items():
+            hosts.setdefault(key.host, {"idle": 0, "in_use": 0})["idle"] += len(idle)
+        for key, in_use in getattr(connector, "_acquired_per_host", {}).items():
+            hosts.setdefault(key.host, {"idle": 0, "in_use": 0})["in_use"] += len(in_use)
+        return {"limit": connector.limit, "limit_per_host": connector.limit_per_host, "hosts": hosts}
+
+    @asynccontextmanager
+    async def _request(self, method: str, url: str, max_retries: int = None, **kwargs):
+        """Sends a request through the shared session once the rate limiter allows it.
+        429s, 5xx and connection errors are retried with backoff, honoring Retry-After.
+        A 429 also pauses the host family in the rate limiter for every other request.
+        """
+        family = host_family(url)
+        attempt = 0
+        refreshed = False
+        call = current_call.get()
+        while True:
+            if family != "auth" and self.expires_at and time.time() >= self.expires_at - self.refresh_margin:
+                await self.refresh_tokens()
+                self._apply_tokens(kwargs)
+                refreshed = True
+            waited = await self.rate_limiter.acquire(family)
+            if call is not None:
+                call.limiter_wait += waited
+                call.requests += 1
+                start = time.perf_counter()
+            try:
+                resp = await self._get_session().request(method, url, **kwargs)
+            except aiohttp.ClientConnectionError:
+                if call is not None:
+                    call.network += time.perf_counter() - start
+                delay = self.retry_policy.next_delay(attempt, max_retries=max_retries)
+                if delay is None:
+                    raise
+            else:
+                if call is not None:
+                    call.network += time.perf_counter() - start
+                    call.host = urlsplit(url).hostname
+                    call.status = resp.status
+                if resp.status == 401 and not refreshed and self._auth is not None and family != "auth":
+                    # The token was revoked or expired early, refresh it once and resend
+                    resp.release()
+                    await self.refresh_tokens()
+                    self._apply_tokens(kwargs)
+                    refreshed = True
+                    continue
+                if resp.status not in RETRY_STATUSES:
+                    break
+                retry_after = parse_retry_after(resp.headers.get("Retry-After"))
+                if resp.status == 429:
+                    # Every 429 pauses the family, also when this request gives up on it
+                    self.rate_limiter.throttle(
+                        family, retry_after if retry_after is not None else self.retry_policy.backoff(attempt)
+                    )
+                delay = self.retry_policy.next_delay(attempt, retry_after, max_retries)
+                if delay is None:
+                    break
+                resp.release()
+            attempt += 1
+            await asyncio.sleep(delay)
+
+        async with resp:
+            yield resp
+
+    def _apply_tokens(self, kwargs: dict) -> None:
+        """Puts the current tokens in the headers of a request that was built with old ones."""
+        headers = kwargs.get("headers")
+        if not headers:
+            return
+        headers = dict(headers)
+        if "Authorization" in headers:
+            headers["Authorization"] = f"Bearer {self.access_token}"
+        if "X-Riot-Entitlements-JWT" in headers:
+            headers["X-Riot-Entitlements-JWT"] = self.entitlements_token
+        kwargs["headers"] = headers
+
+    @instrumented
+    async def refresh_tokens(self) -> None:
+        """Gets new tokens with the login cookies, falling back to a full login.
+        Concurrent callers share one refresh.
+        """
+        if self._refresh is None or self._refresh.done():
+            self._refresh = asyncio.ensure_future(self._refresh_tokens())
+        await asyncio.shield(self._refresh)
+
+    async def _refresh_tokens(self) -> None:
+        if self._auth is None:
+            raise Exceptions.NotAuthorized("You must authorize before using this function.")
+        await self.rate_limiter.acquire("auth")
+        if not await self._auth.reauthorize():
+            if self.username is None or self.password is None:
+                raise Exceptions.NotAuthorized("The login cookies expired, authorize again.")
+            await self.rate_limiter.acquire("auth")
+            if await self._auth.authorize(self.username, self.password) != "Success":
+                raise Exceptions.NotAuthorized("The login needs a multi-factor code, authorize again.")
+        self._update_tokens()
+
+    def _update_tokens(self) -> None:
+        self.access_token = self._auth.access_token
+        self.entitlements_token = self._auth.entitlements_token
+        self.expires_at = self._auth.expires_at or 0
+        if self.cookie_path is not None:
+            self._auth.save_cookies(self.cookie_path)
+            with open(self.cookie_path + ".account", "w") as file:
+                json.dump({"username": self.username}, file)
+
+    def _cookies_saved_by(self, username: str) -> bool:
+        """Whether the cookies at cookie_path are from a login of `username`, so they can't log in another account."""
+        try:
+            with open(self.cookie_path + ".account") as file:
+                saved = json.load(file).get("username")
+        except (OSError, ValueError, AttributeError):
+            return False
+        return isinstance(saved, str) and saved.lower() == username.lower()
+
+    async def _cached_get(self, endpoint: str, url: str, headers: dict = None):
+        """GETs a json endpoint through the response cache, if the client has one.
+        Stale entries are revalidated with ETag/Last-Modified when the server sent them.
+        """
+        ttl = self.response_cache.ttl(endpoint) if self.response_cache is not None else None
+        if ttl is None:
+            async with self._request("GET", url, headers=headers) as resp:
+                return await content_verify(response=resp)
+
+        entry = await self.response_cache.get(url, self.client_version)
+        if entry is not None and entry.fresh:
+            return entry.data
+
+        headers = dict(headers or {})
+        if entry is not None:
+            if entry.etag is not None:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified is not None:
+                headers["If-Modified-Since"] = entry.last_modified
+
+        async with self._request("GET", url, headers=headers) as resp:
+            if resp.status == 304 and entry is not None:
+                entry.expires_at = time.time() + ttl
+                await self.response_cache.set(url, entry)
+                return entry.data
+            data = await content_verify(response=resp)
+            if resp.status == 200 and data is not None:
+                await self.response_cache.set(url, CacheEntry(
+                    data=data,
+                    expires_at=time.time() + ttl,
+                    client_version=self.client_version,
+                    etag=resp.headers.get("ETag"),
+                    last_modified=resp.headers.get("Last-Modified"),
+                ))
+            return data
+
     async def SetTokens(self, access_token: str, entitlements_token: str):
         """Sets tokens."""
         self.access_token = access_token
         self.entitlements_token = entitlements_token
+        self.expires_at = 0
 
 
-    @Limiter()
+    @instrumented
     async def RSO_GetPlayerInfo(self):
         """Gets player info."""
-        async with aiohttp.ClientSession() as session:
-            headers = {
-                "Authorization": f"Bearer {self.access_token}"
-            }
-            async with session.get(f"https://auth.riotgames.com/userinfo", headers=headers) as resp:
-                return await content_verify(response=resp)
+        headers = {
+            "Authorization": f"Bearer {self.access_token}"
+        }
+        async with self._request("GET", f"https://auth.riotgames.com/userinfo", headers=headers) as resp:
+            return await content_verify(response=resp)
     
     
-    @Limiter()
+    @instrumented
     async def authorize(self, username: str, password: str, use_query_response_mode: bool = False, multi_factor_code: str = None) -> None:
         """Authorizes the client and gets entitlements token and access token."""
+        await self.rate_limiter.acquire("auth")
+        if self._auth is None or username != self.username:
+            self._auth = riot_auth.RiotAuth(
+                riot_client_build=await version.get_riot_client_build_async(self._get_session()),
+                trace_configs=[self.tracer.trace_config()] if self.tracer is not None else None,
+            )
+            if self.cookie_path is not None and os.path.exists(self.cookie_path) and self._cookies_saved_by(username):
+                self._auth.load_cookies(self.cookie_path)
         self.username = username
         self.password = password
-
-        auth = riot_auth.RiotAuth()
-        await auth.authorize(username, password)
-        self.entitlements_token = auth.entitlements_token
-        self.access_token = auth.access_token
+        # Cookies of an earlier login (or a restarted process) skip the credential login
+        if not await self._auth.reauthorize():
+            await self._auth.authorize(username, password, use_query_response_mode)
+        self._update_tokens()
         
         player_info = await self.RSO_GetPlayerInfo()
         self.puuid = player_info["sub"]
 
     
     # PVP Endpoints
-    @Limiter()
+    @instrumented
     async def Content_FetchContent(self, region: str = None):
         """Fetches content."""
         if region is None:
@@ -104,20 +502,14 @@ class Client:
             else:
                 shard_region = region.lower()
         
-        async with aiohttp.ClientSession() as session:
-            headers = {
-                "X-Riot-ClientPlatform": self.client_platform,
-                "X-Riot-ClientVersion": self.client_version
-            }
-            async with session.get(f"https://{region}.api.riotgames.com/val/content/v1/contents", headers=headers) as resp:
-                contentType = resp.headers.get("Content-Type")
-                if contentType == "application/json; charset=utf-8" or contentType == "application/json":
-                    return await resp.json()
-                elif contentType == "text/plain; charset=utf-8" or contentType == "text/plain":
-                    return json.loads(await resp.text())
+        headers = {
+            "X-Riot-ClientPlatform": self.client_platform,
+            "X-Riot-ClientVersion": self.client_version
+        }
+        return await self._cached_get("Content_FetchContent", f"https://{region}.api.riotgames.com/val/content/v1/contents", headers)
     
     
-    @Limiter()
+    @instrumented
     async def AccountXP_GetPlayer(self, puuid: str = None, region: str = None):
         """Gets player's account XP."""
         if self.entitlements_token is None or self.access_token is None:
@@ -136,16 +528,15 @@ class Client:
             else:
                 shard_region = region.lower()
 
-        async with aiohttp.ClientSession() as session:
-            headers = {
-                "Authorization": f"Bearer {self.access_token}",
-                "X-Riot-Entitlements-JWT": self.entitlements_token
-            }
-            async with session.get(f"https://pd.{shard_region}.a.pvp.net/account-xp/v1/players/{puuid}", headers=headers) as resp:
-                return json.loads(await resp.text())
+        headers = {
+            "Authorization": f"Bearer {self.access_token}",
+            "X-Riot-Entitlements-JWT": self.entitlements_token
+        }
+        async with self._request("GET", f"https://pd.{shard_region}.a.pvp.net/account-xp/v1/players/{puuid}", headers=headers) as resp:
+            return await content_verify(response=resp)
     
     
-    @Limiter()
+    @instrumented
     async def MMR_FetchPlayer(self, puuid: str = None, region: str = None):
         """Fetches player's MMR."""
         if self.entitlements_token is None or self.access_token is None:
@@ -164,21 +555,22 @@ class Client:
             else:
                 shard_region = region.lower()
 
-        async with aiohttp.ClientSession() as session:
-            headers = {
-                "Authorization": f"Bearer {self.access_token}",
-                "X-Riot-Entitlements-JWT": self.entitlements_token,
-                "X-Riot-ClientPlatform": self.client_platform,
-                "X-Riot-ClientVersion": self.client_version
-            }
-            async with session.get(f"https://pd.{shard_region}.a.pvp.net/mmr/v1/players/{puuid}", headers=headers) as resp:
-                return await content_verify(response=resp)
+        headers = {
+            "Authorization": f"Bearer {self.access_token}",
+            "X-Riot-Entitlements-JWT": self.entitlements_token,
+            "X-Riot-ClientPlatform": self.client_platform,
+            "X-Riot-ClientVersion": self.client_version
+        }
+        async with self._request("GET", f"https://pd.{shard_region}.a.pvp.net/mmr/v1/players/{puuid}", headers=headers) as resp:
+            return await content_verify(response=resp)
     
     
-    @Limiter()
-    async def MatchHistory_FetchMatchHistory(self, puuid: str = None, region: str = None, start_index: int =0, end_index: int = 25, queue_id: str="null") -> MatchHistory:
+    @instrumented
+    async def MatchHistory_FetchMatchHistory(self, puuid: str = None, region: str = None, start_index: int =0, end_index: int = 25, queue_id: str="null",
+                                             mode: str = "model") -> MatchHistory:
         """Fetches match history.
         Pass in a queue_id to filter by queue. Start & End Index should be chunk of 25.
+        mode: "model" (MatchHistory), "dict" (the json) or "bytes" (the raw body).
         Valid queue IDs: queues = [
                                     "competitive",
                                     "custom",
@@ -212,27 +604,50 @@ class Client:
         
         if queue_id not in ["competitive", "custom", "deathmatch", "ggteam", "snowball", "spikerush", "unrated", "onefa", "null"]:
             raise Exceptions.InvalidQueueID('Invalid queue ID. Valid queue IDs: queues = ["competitive", "custom", "deathmatch", "ggteam", "snowball", "spikerush", "unrated", "onefa", "null"]')
+        check_response_mode(mode)
 
-        async with aiohttp.ClientSession() as session:
-            headers = {
-                "Authorization": f"Bearer {self.access_token}",
-                "X-Riot-Entitlements-JWT": self.entitlements_token,
-                "X-Riot-ClientPlatform": self.client_platform,
-                "X-Riot-ClientVersion": self.client_version
-            }
-            async with session.get(f"https://pd.{shard_region}.a.pvp.net/match-history/v1/history/{puuid}?startIndex={start_index}&endIndex={end_index}"
-            + (f"&queue={queue_id}" if queue_id != "null" else ""), headers=headers) as resp:
-                if resp.get("httpStatus") != None:
-                    return fromdict(httpStatusError, await content_verify(response=resp))
-                else:
-                    return fromdict(MatchHistory, await content_verify(response=resp))
+        headers = {
+            "Authorization": f"Bearer {self.access_token}",
+            "X-Riot-Entitlements-JWT": self.entitlements_token,
+            "X-Riot-ClientPlatform": self.client_platform,
+            "X-Riot-ClientVersion": self.client_version
+        }
+        async with self._request("GET", f"https://pd.{shard_region}.a.pvp.net/match-history/v1/history/{puuid}?startIndex={start_index}&endIndex={end_index}"
+        + (f"&queue={queue_id}" if queue_id != "null" else ""), headers=headers) as resp:
+            return await read_response(resp, MatchHistory, mode)
+    
+    
+    def iter_match_history(self, puuid: str = None, queue_id: str = "null", max_items: int = None, prefetch: int = 2,
+                           region: str = None, page_size: int = 25) -> AsyncIterator[History]:
+        """Yields a player's match history entries, paging through it in chunks of `page_size`.
+        The first page gives the total, then up to `prefetch` following pages are fetched
+        while the current one is being consumed.
+        Example:
+            async for entry in client.iter_match_history(queue_id="competitive", max_items=500):
+                print(entry.match_id)
+        """
+        page_size = min(page_size, 25)
+
+        async def fetch(start: int):
+            page = await self.MatchHistory_FetchMatchHistory(puuid, region, start, start + page_size, queue_id)
+            if isinstance(page, httpStatusError):
+                raise Exceptions.RequestFailed(f"{page.httpStatus} {page.errorCode}: {page.message}")
+            return page
+
+        return paged(fetch, lambda page: page.history, lambda page: page.total, page_size, prefetch, max_items)
     
     
-    @Limiter()
-    async def MatchDetails_FetchMatchDetails(self, matchId: str, region: str = None) -> MatchDetails:
-        """Fetches match details."""
+    async def MatchDetails_FetchMatchDetails(self, matchId: str, region: str = None, lazy: bool = False, mode: str = "model") -> MatchDetails:
+        """Fetches match details.
+        If the client has a match_store, stored matches are read from it and completed
+        matches are added to it after being fetched.
+        Pass lazy=True to get a LazyMatchDetails, which only builds the sections you read.
+        mode: "model" (MatchDetails), "dict" (the json) or "bytes" (the raw body, which is
+        never decoded, e.g. to forward it to storage).
+        """
         if self.entitlements_token is None or self.access_token is None:
             raise Exceptions.NotAuthorized("You must authorize before using this function.")
+        check_response_mode(mode)
 
         if region is None:
             region = self.region
@@ -244,26 +659,65 @@ class Client:
             else:
                 shard_region = region.lower()
 
-        async with aiohttp.ClientSession() as session:
-            headers = {
-                "Authorization": f"Bearer {self.access_token}",
-                "X-Riot-Entitlements-JWT": self.entitlements_token
-            }
-            async with session.get(f"https://pd.{shard_region}.a.pvp.net/match-details/v1/matches/{matchId}", headers=headers) as resp:
-                try:
-                    if resp.get("httpStatus") != None:
-                        return fromdict(httpStatusError, await content_verify(response=resp))
-                    else:
-                        ret= fromdict(MatchDetails, await content_verify(response=resp))
-                        return ret
-                except ParseError as err:
-                    print("Warning!!! Failed to parse the file. You are returned with a json struct.")
-                    print("Either change the modify the MatchDetails class in mmr.py & submit an issue to github")
-                    print(err)
-                    return await content_verify(response=resp)
-    
-    
-    @Limiter()
+        headers = {
+            "Authorization": f"Bearer {self.access_token}",
+            "X-Riot-Entitlements-JWT": self.entitlements_token
+        }
+        if mode == "bytes":
+            body = None
+            if self.match_store is not None:
+                body = await self.match_store.get_bytes(matchId)
+            if body is None:
+                async with self._request("GET", f"https://pd.{shard_region}.a.pvp.net/match-details/v1/matches/{matchId}", headers=headers) as resp:
+                    body = await read_response(resp, MatchDetails, mode)
+                if isinstance(body, httpStatusError):
+                    return body
+                if self.match_store is not None and MATCH_COMPLETED.search(body):
+                    await self.match_store.put_bytes(matchId, body)
+            return body
+
+        data = None
+        if self.match_store is not None:
+            data = await self.match_store.get(matchId)
+        if data is None:
+            async with self._request("GET", f"https://pd.{shard_region}.a.pvp.net/match-details/v1/matches/{matchId}", headers=headers) as resp:
+                if resp.status >= 400:
+                    return await read_error(resp)
+                data = await content_verify(response=resp)
+            if self.match_store is not None and isinstance(data, dict) and data.get("matchInfo", {}).get("isCompleted"):
+                await self.match_store.put(matchId, data)
+
+        if mode == "dict":
+            return data
+        if lazy:
+            return LazyMatchDetails(data)
+        try:
+            return decode_model(MatchDetails, data)
+        except ParseError as err:
+            print("Warning!!! Failed to parse the file. You are returned with a json struct.")
+            print("Either change the modify the MatchDetails class in mmr.py & submit an issue to github")
+            print(err)
+            return data
+    
+    
+    async def fetch_match_details_many(self, match_ids: Iterable[str], concurrency: int = 10, region: str = None,
+                                       lazy: bool = False, mode: str = "model") -> AsyncIterator[BatchResult]:
+        """Fetches many match details concurrently, yielding a BatchResult as each one completes.
+        Requests share the client's connection pool & rate limiter. A failed match is reported
+        in its BatchResult's `error` and does not stop the others.
+        Example:
+            async for item in client.fetch_match_details_many(match_ids, concurrency=20):
+                if item.ok:
+                    save(item.result)
+        """
+        async def fetch(match_id: str):
+            return await self.MatchDetails_FetchMatchDetails(match_id, region=region, lazy=lazy, mode=mode)
+
+        async for item in stream(match_ids, fetch, concurrency):
+            yield item
+    
+    
+    @instrumented
     async def MMR_FetchCompetitiveUpdates(self, puuid: str = None, region: str = None):
         """Fetches competitive updates."""
         if self.entitlements_token is None or self.access_token is None:
@@ -282,17 +736,16 @@ class Client:
             else:
                 shard_region = region.lower()
 
-        async with aiohttp.ClientSession() as session:
-            headers = {
-                "Authorization": f"Bearer {self.access_token}",
-                "X-Riot-Entitlements-JWT": self.entitlements_token,
-                "X-Riot-ClientPlatform": self.client_platform
-            }
-            async with session.get(f"https://pd.{shard_region}.a.pvp.net/mmr/v1/players/{puuid}/competitiveupdates", headers=headers) as resp:
-                return await content_verify(response=resp)
+        headers = {
+            "Authorization": f"Bearer {self.access_token}",
+            "X-Riot-Entitlements-JWT": self.entitlements_token,
+            "X-Riot-ClientPlatform": self.client_platform
+        }
+        async with self._request("GET", f"https://pd.{shard_region}.a.pvp.net/mmr/v1/players/{puuid}/competitiveupdates", headers=headers) as resp:
+            return await content_verify(response=resp)
     
     
-    @Limiter()
+    @instrumented
     async def MMR_FetchLeaderboard(self, seasonId: str, startIndex: int = 0, size: int = 200, region: str = None):
         """Fetches Leaderboard."""
         if self.entitlements_token is None or self.access_token is None:
@@ -308,17 +761,45 @@ class Client:
             else:
                 shard_region = region.lower()
 
-        async with aiohttp.ClientSession() as session:
-            headers = {
-                "Authorization": f"Bearer {self.access_token}",
-                "X-Riot-Entitlements-JWT": self.entitlements_token,
-                "X-Riot-ClientVersion": self.client_version
-            }
-            async with session.get(f"https://pd.{shard_region}.a.pvp.net/mmr/v1/leaderboards/affinity/na/queue/competitive/season/{seasonId}?startIndex=0&size={size}", headers=headers) as resp:
-                return await content_verify(response=resp)
+        headers = {
+            "Authorization": f"Bearer {self.access_token}",
+            "X-Riot-Entitlements-JWT": self.entitlements_token,
+            "X-Riot-ClientVersion": self.client_version
+        }
+        async with self._request("GET", f"https://pd.{shard_region}.a.pvp.net/mmr/v1/leaderboards/affinity/{region}/queue/competitive/season/{seasonId}?startIndex={startIndex}&size={size}", headers=headers) as resp:
+            return await content_verify(response=resp)
+    
+    
+    def iter_leaderboard(self, seasonId: str, page_size: int = 200, concurrency: int = 4, max_items: int = None,
+                         region: str = None) -> AsyncIterator[Dict]:
+        """Yields every player of a leaderboard in rank order.
+        The first page gives the total, then up to `concurrency` pages are fetched at once.
+        Only those pages are held in memory.
+        """
+        async def fetch(start: int):
+            page = await self.MMR_FetchLeaderboard(seasonId, start, page_size, region)
+            if page is None or "httpStatus" in page:
+                raise Exceptions.RequestFailed(f"Failed to fetch leaderboard page at {start}: {page}")
+            return page
+
+        return paged(fetch, lambda page: page["Players"], lambda page: page["totalPlayers"], page_size, concurrency,
+                     max_items)
+    
+    
+    async def dump_leaderboard(self, seasonId: str, sink: Union[str, TextIO], format: str = None, page_size: int = 200,
+                               concurrency: int = 4, region: str = None) -> int:
+        """Streams a whole leaderboard to a file path or text file object, returns the number of players written.
+        format is "ndjson" or "csv", guessed from the file extension if not given.
+        """
+        count = 0
+        with open_sink(sink, format) as write:
+            async for player in self.iter_leaderboard(seasonId, page_size, concurrency, region=region):
+                write(player)
+                count += 1
+        return count
     
     
-    @Limiter()
+    @instrumented
     async def Restrictions_FetchPlayerRestrictionsV2(self, region: str = None):
         """Fetches player restrictions."""
         if self.entitlements_token is None or self.access_token is None:
@@ -334,16 +815,15 @@ class Client:
             else:
                 shard_region = region.lower()
 
-        async with aiohttp.ClientSession() as session:
-            headers = {
-                "Authorization": f"Bearer {self.access_token}",
-                "X-Riot-Entitlements-JWT": self.entitlements_token
-            }
-            async with session.get(f"https://pd.{shard_region}.a.pvp.net/restrictions/v3/penalties", headers=headers) as resp:
-                return await content_verify(response=resp)
+        headers = {
+            "Authorization": f"Bearer {self.access_token}",
+            "X-Riot-Entitlements-JWT": self.entitlements_token
+        }
+        async with self._request("GET", f"https://pd.{shard_region}.a.pvp.net/restrictions/v3/penalties", headers=headers) as resp:
+            return await content_verify(response=resp)
     
     
-    @Limiter()
+    @instrumented
     async def ItemProgressionDefinitionsV2_Fetch(self, region: str = None):
         """Fetches item progression definitions."""
         if self.entitlements_token is None or self.access_token is None:
@@ -359,16 +839,14 @@ class Client:
             else:
                 shard_region = region.lower()
 
-        async with aiohttp.ClientSession() as session:
-            headers = {
-                "Authorization": f"Bearer {self.access_token}",
-                "X-Riot-Entitlements-JWT": self.entitlements_token
-            }
-            async with session.get(f"https://pd.{shard_region}.a.pvp.net/contract-definitions/v3/item-upgrades", headers=headers) as resp:
-                return await content_verify(response=resp)
+        headers = {
+            "Authorization": f"Bearer {self.access_token}",
+            "X-Riot-Entitlements-JWT": self.entitlements_token
+        }
+        return await self._cached_get("ItemProgressionDefinitionsV2_Fetch", f"https://pd.{shard_region}.a.pvp.net/contract-definitions/v3/item-upgrades", headers)
 
 
-    @Limiter()
+    @instrumented
     async def Config_FetchConfig(self, region: str = None):
         """Fetch Config."""
         if region is None:
@@ -381,17 +859,18 @@ class Client:
             else:
                 shard_region = region.lower()
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"https://shared.{shard_region}.a.pvp.net/v1/config/{region}") as resp:
-                return await content_verify(response=resp)
+        return await self._cached_get("Config_FetchConfig", f"https://shared.{shard_region}.a.pvp.net/v1/config/{region}")
     
     
-    @Limiter()
-    async def Pregame_GetPlayer(self, region: str = None) -> dict:
+    @instrumented
+    async def Pregame_GetPlayer(self, region: str = None, puuid: str = None) -> dict:
         """Get the ID of a game in the pre-game stage"""
         if self.entitlements_token is None or self.access_token is None:
             raise Exceptions.NotAuthorized("You must authorize before using this function.")
 
+        if puuid is None:
+            puuid = self.puuid
+
         if region is None:
             region = self.region
             shard_region = self.shard_region
@@ -402,20 +881,23 @@ class Client:
             else:
                 shard_region = region.lower()
 
-        async with aiohttp.ClientSession() as session:
-            headers = {
-                "Authorization": f"Bearer {self.access_token}",
-                "X-Riot-Entitlements-JWT": self.entitlements_token
-            }
-            async with session.get(f"https://glz-{region}-1.{shard_region}.a.pvp.net/pregame/v1/players/{self.puuid}", headers=headers) as resp:
-                return await content_verify(response=resp)
-
-
-    @Limiter()
-    async def Pregame_GetMatch(self, region: str = None, match_id: str=None) -> PreGameDetails:
-        """Get info for a game in the pre-game stage"""
+        headers = {
+            "Authorization": f"Bearer {self.access_token}",
+            "X-Riot-Entitlements-JWT": self.entitlements_token
+        }
+        async with self._request("GET", f"https://glz-{region}-1.{shard_region}.a.pvp.net/pregame/v1/players/{puuid}", headers=headers) as resp:
+            return await content_verify(response=resp)
+
+
+    @instrumented
+    async def Pregame_GetMatch(self, region: str = None, match_id: str=None, mode: str = "dict") -> PreGameDetails:
+        """Get info for a game in the pre-game stage
+        mode: "dict" (the json), "model" (PreGameDetails) or "bytes" (the raw body).
+        Errors are returned as an httpStatusError in every mode.
+        """
         if self.entitlements_token is None or self.access_token is None:
             raise Exceptions.NotAuthorized("You must authorize before using this function.")
+        check_response_mode(mode)
 
         if region is None:
             region = self.region
@@ -432,18 +914,17 @@ class Client:
             match_id = res.get("MatchID")
 
 
-        async with aiohttp.ClientSession() as session:
-            headers = {
-                "Authorization": f"Bearer {self.access_token}",
-                "X-Riot-Entitlements-JWT": self.entitlements_token
-            }
-            async with session.get(f"https://glz-{region}-1.{shard_region}.a.pvp.net/pregame/v1/matches/{match_id}", headers=headers) as resp:
-                return await content_verify(response=resp)
+        headers = {
+            "Authorization": f"Bearer {self.access_token}",
+            "X-Riot-Entitlements-JWT": self.entitlements_token
+        }
+        async with self._request("GET", f"https://glz-{region}-1.{shard_region}.a.pvp.net/pregame/v1/matches/{match_id}", headers=headers) as resp:
+            return await read_response(resp, PreGameDetails, mode)
 
 
     #Current Game Endpoints
-    @Limiter()
-    async def CoreGame_GetPlayer(self, region: str = None) -> dict:
+    @instrumented
+    async def CoreGame_GetPlayer(self, region: str = None, puuid: str = None) -> dict:
         """Get the ID of a game in progress
         this api & PreGame_GetPlayer() api returns the same results.
         So, if the game is already in CoreGame stage. Then use this method
@@ -453,6 +934,9 @@ class Client:
         if self.entitlements_token is None or self.access_token is None:
             raise Exceptions.NotAuthorized("You must authorize before using this function.")
 
+        if puuid is None:
+            puuid = self.puuid
+
         if region is None:
             region = self.region
             shard_region = self.shard_region
@@ -463,20 +947,22 @@ class Client:
             else:
                 shard_region = region.lower()
 
-        async with aiohttp.ClientSession() as session:
-            headers = {
-                "Authorization": f"Bearer {self.access_token}",
-                "X-Riot-Entitlements-JWT": self.entitlements_token
-            }
-            async with session.get(f"https://glz-{region}-1.{shard_region}.a.pvp.net/core-game/v1/players/{self.puuid}", headers=headers) as resp:
-                return await content_verify(response=resp)
+        headers = {
+            "Authorization": f"Bearer {self.access_token}",
+            "X-Riot-Entitlements-JWT": self.entitlements_token
+        }
+        async with self._request("GET", f"https://glz-{region}-1.{shard_region}.a.pvp.net/core-game/v1/players/{puuid}", headers=headers) as resp:
+            return await content_verify(response=resp)
     
     
-    @Limiter()
-    async def CoreGame_FetchMatch(self, region: str = None, match_id: str = None) -> CoreGameDetails:
-        """Get match details of a game in progress"""
+    @instrumented
+    async def CoreGame_FetchMatch(self, region: str = None, match_id: str = None, mode: str = "model") -> CoreGameDetails:
+        """Get match details of a game in progress
+        mode: "model" (CoreGameDetails), "dict" (the json) or "bytes" (the raw body).
+        """
         if self.entitlements_token is None or self.access_token is None:
             raise Exceptions.NotAuthorized("You must authorize before using this function.")
+        check_response_mode(mode)
 
         if region is None:
             region = self.region
@@ -492,19 +978,83 @@ class Client:
             res = await self.CoreGame_GetPlayer()
             match_id = res.get("MatchID")
 
-        async with aiohttp.ClientSession() as session:
-            headers = {
-                "Authorization": f"Bearer {self.access_token}",
-                "X-Riot-Entitlements-JWT": self.entitlements_token
-            }
-            async with session.get(f"https://glz-{region}-1.{shard_region}.a.pvp.net/core-game/v1/matches/{match_id}", headers=headers) as resp:
-                if resp.get("httpStatus") != None:
-                    return fromdict(httpStatusError, await content_verify(response=resp))
+        headers = {
+            "Authorization": f"Bearer {self.access_token}",
+            "X-Riot-Entitlements-JWT": self.entitlements_token
+        }
+        async with self._request("GET", f"https://glz-{region}-1.{shard_region}.a.pvp.net/core-game/v1/matches/{match_id}", headers=headers) as resp:
+            return await read_response(resp, CoreGameDetails, mode)
+    
+    
+    async def fetch_live_match_bundle(self, match_id: str = None, region: str = None, names: bool = True,
+                                      mmr: bool = True) -> LiveMatchBundle:
+        """Fetches a game in progress with its loadouts and every player's name & MMR.
+        Requests run as soon as what they need is known: the loadouts with the match, then the
+        names (one name-service call) and the MMR of each distinct player together.
+        A failed match raises Exceptions.RequestFailed, other failures are kept in `errors`.
+        """
+        if self.entitlements_token is None or self.access_token is None:
+            raise Exceptions.NotAuthorized("You must authorize before using this function.")
+
+        if match_id is None:
+            player = await self.CoreGame_GetPlayer(region)
+            match_id = player.get("MatchID") if isinstance(player, dict) else None
+            if not match_id:
+                raise Exceptions.RequestFailed("The player is not in a game.")
+
+        loadouts = asyncio.ensure_future(self.CoreGame_FetchMatchLoadouts(region, match_id))
+        try:
+            match = await self.CoreGame_FetchMatch(region, match_id)
+            if isinstance(match, httpStatusError):
+                raise Exceptions.RequestFailed(f"{match.httpStatus} {match.errorCode}: {match.message}")
+            bundle = LiveMatchBundle(match_id=match_id, match=match)
+            puuids = list(dict.fromkeys(player.subject for player in match.players))
+
+            async def fetch_names():
+                bundle.names = await self.names.resolve_many(puuids, region) if names else {}
+
+            async def fetch_mmr(puuid: str):
+                result = await self.MMR_FetchPlayer(puuid, region)
+                if error_status(result) is None:
+                    bundle.mmr[puuid] = result
+                else:
+                    bundle.errors[puuid] = result
+
+            keys = ["loadouts", "names"] + (puuids if mmr else [])
+            results = await asyncio.gather(
+                loadouts, fetch_names(), *(fetch_mmr(puuid) for puuid in keys[2:]), return_exceptions=True
+            )
+        finally:
+            loadouts.cancel()
+
+        for key, result in zip(keys, results):
+            if isinstance(result, asyncio.CancelledError):
+                raise result
+            if isinstance(result, BaseException):
+                bundle.errors[key] = result
+        if error_status(results[0]) is not None:
+            bundle.errors["loadouts"] = results[0]
+        elif not isinstance(results[0], BaseException):
+            bundle.loadouts = results[0]
+        return bundle
+    
+    
+    def watch_player(self, puuid: str = None, region: str = None, **intervals) -> PlayerWatcher:
+        """Watches a player's live game, yielding a LiveEvent when its phase or state changes.
+        Polling adapts to the phase, see PlayerWatcher for the `intervals`.
+        Example:
+            async for event in client.watch_player():
+                if event.kind == "phase":
+                    print(event.previous_phase, "->", event.phase, event.match_id)
                 else:
-                    return fromdict(CoreGameDetails, await content_verify(response=resp))
+                    print(event.changes)
+        """
+        if self.entitlements_token is None or self.access_token is None:
+            raise Exceptions.NotAuthorized("You must authorize before using this function.")
+        return PlayerWatcher(self, puuid, region, **intervals)
     
     
-    @Limiter()
+    @instrumented
     async def CoreGame_FetchMatchLoadouts(self, region: str = None, match_id: str = None) -> CoreGameMatchLoadout:
         """Get player skins and spray for a game in progress.
         It will return a CoreGameMatchLoadout Object.
@@ -526,21 +1076,20 @@ class Client:
             res = await self.CoreGame_GetPlayer()
             match_id = res.get("MatchID")
 
-        async with aiohttp.ClientSession() as session:
-            headers = {
-                "Authorization": f"Bearer {self.access_token}",
-                "X-Riot-Entitlements-JWT": self.entitlements_token
-            }
-            async with session.get(f"https://glz-{region}-1.{shard_region}.a.pvp.net/core-game/v1/matches/{match_id}/loadouts", headers=headers) as resp:
-                if resp.get("httpStatus") != None:
-                    return fromdict(httpStatusError, await content_verify(response=resp))
-                else:
-                    return fromdict(CoreGameMatchLoadout, await content_verify(response=resp))
+        headers = {
+            "Authorization": f"Bearer {self.access_token}",
+            "X-Riot-Entitlements-JWT": self.entitlements_token
+        }
+        async with self._request("GET", f"https://glz-{region}-1.{shard_region}.a.pvp.net/core-game/v1/matches/{match_id}/loadouts", headers=headers) as resp:
+            if resp.status >= 400:
+                return await read_error(resp)
+            else:
+                return decode_model(CoreGameMatchLoadout, await content_verify(response=resp))
 
 
 
     # Store Endpoints
-    @Limiter()
+    @instrumented
     async def Store_GetOffers(self, region: str = None):
         """Gets store offers."""
         if region is None:
@@ -557,12 +1106,10 @@ class Client:
                 "Authorization": f"Bearer {self.access_token}",
                 "X-Riot-Entitlements-JWT": self.entitlements_token
             }
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"https://store.{region}.a.pvp.net/store/v2/offers", headers=headers) as resp:
-                return await content_verify(response=resp)
+        return await self._cached_get("Store_GetOffers", f"https://store.{region}.a.pvp.net/store/v2/offers", headers)
 
 
-    @Limiter()
+    @instrumented
     async def Store_GetStorefrontV2(self, region: str = None, puuid: str = None):
         """Gets storefront."""
         if region is None:
@@ -582,12 +1129,11 @@ class Client:
                 "Authorization": f"Bearer {self.access_token}",
                 "X-Riot-Entitlements-JWT": self.entitlements_token
             }
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"https://pd.{shard_region}.a.pvp.net/store/v2/storefront/{puuid}", headers=headers) as resp:
-                return await content_verify(response=resp)
+        async with self._request("GET", f"https://pd.{shard_region}.a.pvp.net/store/v2/storefront/{puuid}", headers=headers) as resp:
+            return await content_verify(response=resp)
     
     
-    @Limiter()
+    @instrumented
     async def Store_GetWallet(self, region: str = None, puuid: str = None):
         """Gets wallet."""
         if region is None:
@@ -607,12 +1153,11 @@ class Client:
                 "Authorization": f"Bearer {self.access_token}",
                 "X-Riot-Entitlements-JWT": self.entitlements_token
             }
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"https://pd.{shard_region}.a.pvp.net/store/v1/wallet/{puuid}", headers=headers) as resp:
-                return await content_verify(response=resp)
+        async with self._request("GET", f"https://pd.{shard_region}.a.pvp.net/store/v1/wallet/{puuid}", headers=headers) as resp:
+            return await content_verify(response=resp)
     
     
-    @Limiter()
+    @instrumented
     async def Store_GetOrder(self, orderId: str, region: str = None):
         """Get Order."""
         if region is None:
@@ -629,12 +1174,11 @@ class Client:
                 "Authorization": f"Bearer {self.access_token}",
                 "X-Riot-Entitlements-JWT": self.entitlements_token
             }
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"https://pd.{shard_region}.a.pvp.net/store/v1/order/{orderId}", headers=headers) as resp:
-                return await content_verify(response=resp)
+        async with self._request("GET", f"https://pd.{shard_region}.a.pvp.net/store/v1/order/{orderId}", headers=headers) as resp:
+            return await content_verify(response=resp)
 
 
-    @Limiter()
+    @instrumented
     async def Store_GetEntitlements(self, itemTypeId: str, region: str = None, puuid: str = None):
         """Get Entitlements."""
         if region is None:
@@ -654,13 +1198,12 @@ class Client:
                 "Authorization": f"Bearer {self.access_token}",
                 "X-Riot-Entitlements-JWT": self.entitlements_token
             }
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"https://pd.{shard_region}.a.pvp.net/store/v1/entitlements/{puuid}/{itemTypeId}", headers=headers) as resp:
-                return await content_verify(response=resp)                
+        async with self._request("GET", f"https://pd.{shard_region}.a.pvp.net/store/v1/entitlements/{puuid}/{itemTypeId}", headers=headers) as resp:
+            return await content_verify(response=resp)                
 
     
     # Other
-    @Limiter()
+    @instrumented
     async def PlayerPref_SavePreferenceV3(self, region: str = None, puuid: str = None):
         """Save Preference."""
         if puuid is None:
@@ -670,13 +1213,14 @@ class Client:
                 "Authorization": f"Bearer {self.access_token}",
                 "X-Riot-Entitlements-JWT": self.entitlements_token
             }
-        async with aiohttp.ClientSession() as session:
-            async with session.post(f"https://playerpreferences.riotgames.com/playerPref/v3/savePreference", headers=headers) as resp:
-                return await content_verify(response=resp)
+        async with self._request("POST", f"https://playerpreferences.riotgames.com/playerPref/v3/savePreference", headers=headers) as resp:
+            return await content_verify(response=resp)
 
-    @Limiter()
-    async def get_username_from_ids(self, region: str = None, puuids: list = []):
-        """Gets username from List of PUUIDs"""
+    @instrumented
+    async def get_username_from_ids(self, region: str = None, puuids: list = None):
+        """Gets username from List of PUUIDs.
+        Use `client.names` to resolve many names with batching & caching.
+        """
         if region is None:
             region = self.region
             shard_region = self.shard_region
@@ -688,19 +1232,16 @@ class Client:
                 shard_region = region.lower()
 
         if not puuids:
-            puuids.append(self.puuid)
+            puuids = [self.puuid]
 
         headers = {
                 "Authorization": f"Bearer {self.access_token}",
                 "X-Riot-Entitlements-JWT": self.entitlements_token
             }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.put(f"https://pd.{shard_region}.a.pvp.net/name-service/v2/players", headers=headers, data=json.dumps(puuids)) as resp:
-                return await content_verify(response=resp) 
+        async with self._request("PUT", f"https://pd.{shard_region}.a.pvp.net/name-service/v2/players", headers=headers, data=json.dumps(puuids)) as resp:
+            return await content_verify(response=resp) 
 
 
 def get_client_version() -> str:
-    resp = requests.get("https://valorant-api.com/v1/version")
-    respData = resp.json()
-    return respData['data']['riotClientVersion']
+    return version.get_client_version()
@@ -0,0 +1,201 @@
+# Watches a player's live game: polls the pre-game & core-game endpoints,
+# follows the game through its phases and only reports what changed.
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, FrozenSet, Optional, Tuple
+
+import aiohttp
+
+from .response.errors import httpStatusError
+
+IDLE = "idle"
+PREGAME = "pregame"
+INGAME = "in-game"
+POSTGAME = "post-game"
+
+# Keys that change on every poll without anything happening
+IGNORED_KEYS = frozenset(("Version", "PhaseTimeRemainingNS", "StepTimeRemainingNS", "LastUpdated"))
+
+
+@dataclass
+class LiveEvent:
+    """
+    kind: "phase" when the player entered another phase (or another match),
+    "update" when the current match's snapshot changed.
+    changes maps the changed paths (e.g. "AllyTeam.Players[<puuid>].CharacterID")
+    to their (old, new) values, it is empty for phase events.
+    snapshot is the Pregame_GetMatch / CoreGame_FetchMatch json, None when idle or post-game.
+    """
+    kind: str
+    phase: str
+    previous_phase: str
+    match_id: Optional[str]
+    snapshot: Optional[Dict] = None
+    changes: Dict[str, Tuple[Any, Any]] = field(default_factory=dict)
+
+
+@dataclass
+class LiveMatchBundle:
+    """
+    Everything an overlay needs about a game in progress, see Client.fetch_live_match_bundle.
+    names maps each player's puuid to (game_name, tag_line), mmr to their MMR_FetchPlayer json.
+    errors holds what failed without failing the bundle: "loadouts", "names" or a puuid for its MMR,
+    with the exception raised or the error response returned.
+    """
+    match_id: str
+    match: Any
+    loadouts: Any = None
+    names: Dict[str, Optional[Tuple[str, str]]] = field(default_factory=dict)
+    mmr: Dict[str, Any] = field(default_factory=dict)
+    errors: Dict[str, Any] = field(default_factory=dict)
+
+
+def _keyed(items) -> Optional[Dict]:
+    # Lists of players are matched by Subject, so a reordered list isn't a change
+    if not items or not all(isinstance(item, dict) and "Subject" in item for item in items):
+        return None
+    return {item["Subject"]: item for item in items}
+
+
+def _diff(old, new, path: str, ignore: FrozenSet[str], changes: Dict) -> None:
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in list(old) + [key for key in new if key not in old]:
+            if key not in ignore:
+                _diff(old.get(key), new.get(key), f"{path}.{key}" if path else key, ignore, changes)
+    elif isinstance(old, list) and isinstance(new, list):
+        old_keyed, new_keyed = _keyed(old), _keyed(new)
+        if old_keyed is not None and new_keyed is not None:
+            for key in list(old_keyed) + [key for key in new_keyed if key not in old_keyed]:
+                _diff(old_keyed.get(key), new_keyed.get(key), f"{path}[{key}]", ignore, changes)
+        elif len(old) == len(new):
+            for index, (old_item, new_item) in enumerate(zip(old, new)):
+                _diff(old_item, new_item, f"{path}[{index}]", ignore, changes)
+        else:
+            changes[path] = (old, new)
+    elif old != new:
+        changes[path] = (old, new)
+
+
+def diff(old: Any, new: Any, ignore: FrozenSet[str] = IGNORED_KEYS) -> Dict[str, Tuple[Any, Any]]:
+    """Paths of the values that differ between two json snapshots, with their (old, new) values."""
+    changes = {}
+    _diff(old, new, "", ignore, changes)
+    return changes
+
+
+class _TransientError(Exception):
+    """A poll failed in a way that says nothing about the player's phase (429, 5xx, empty body...)."""
+
+
+def _found(data) -> bool:
+    """
+    Whether a poll got the match or player. A 404 means they aren't in that phase,
+    other failures raise _TransientError so the watcher keeps its phase and tries again.
+    """
+    if isinstance(data, httpStatusError):
+        status = data.httpStatus
+    elif isinstance(data, dict):
+        status = data.get("httpStatus", 200)
+    else:
+        raise _TransientError(f"unexpected response: {data!r}")
+    if status == 404:
+        return False
+    if not isinstance(status, int) or status >= 400:
+        raise _TransientError(f"status {status}")
+    return True
+
+
+class PlayerWatcher:
+    def __init__(self, client, puuid: str = None, region: str = None, idle_interval: float = 10,
+                 max_idle_interval: float = 60, pregame_interval: float = 2, ingame_interval: float = 10,
+                 min_interval: float = 0.5, ignore: FrozenSet[str] = IGNORED_KEYS):
+        """
+        Follows a player through idle -> pregame -> in-game -> post-game -> idle.
+        Idle polls start every `idle_interval` seconds and slow down to `max_idle_interval`
+        while nothing happens. Pre-game is polled every `pregame_interval` seconds, or when
+        the phase ends if that's sooner (PhaseTimeRemainingNS), a game in progress every
+        `ingame_interval` seconds. Once in a match only that match is polled.
+        """
+        self.client = client
+        self.puuid = puuid
+        self.region = region
+        self.idle_interval = idle_interval
+        self.max_idle_interval = max_idle_interval
+        self.pregame_interval = pregame_interval
+        self.ingame_interval = ingame_interval
+        self.min_interval = min_interval
+        self.ignore = ignore
+        self.phase = IDLE
+        self.match_id: Optional[str] = None
+        self.snapshot: Optional[Dict] = None
+        self._idle_delay = idle_interval
+
+    def __aiter__(self) -> AsyncIterator[LiveEvent]:
+        return self.events()
+
+    async def events(self) -> AsyncIterator[LiveEvent]:
+        while True:
+            try:
+                phase, match_id, snapshot = await self._poll()
+            except (aiohttp.ClientError, asyncio.TimeoutError, _TransientError):
+                # _request already retried, try again on the next poll
+                await asyncio.sleep(self._delay())
+                continue
+            event = self._update(phase, match_id, snapshot)
+            if event is not None:
+                yield event
+            await asyncio.sleep(self._delay())
+
+    async def _poll(self) -> Tuple[str, Optional[str], Optional[Dict]]:
+        if self.phase == PREGAME:
+            data = await self.client.Pregame_GetMatch(self.region, self.match_id, mode="dict")
+            if _found(data):
+                return PREGAME, self.match_id, data
+            # Either the game loaded or the match was dodged
+            return await self._find()
+        if self.phase == INGAME:
+            data = await self.client.CoreGame_FetchMatch(self.region, self.match_id, mode="dict")
+            if _found(data):
+                return INGAME, self.match_id, data
+            found = await self._find()
+            return (POSTGAME, self.match_id, None) if found[0] == IDLE else found
+        return await self._find()
+
+    async def _find(self) -> Tuple[str, Optional[str], Optional[Dict]]:
+        player = await self.client.Pregame_GetPlayer(self.region, self.puuid)
+        match_id = player.get("MatchID") if _found(player) else None
+        if match_id:
+            data = await self.client.Pregame_GetMatch(self.region, match_id, mode="dict")
+            if _found(data):
+                return PREGAME, match_id, data
+        player = await self.client.CoreGame_GetPlayer(self.region, self.puuid)
+        match_id = player.get("MatchID") if _found(player) else None
+        if match_id:
+            data = await self.client.CoreGame_FetchMatch(self.region, match_id, mode="dict")
+            if _found(data):
+                return INGAME, match_id, data
+        return IDLE, None, None
+
+    def _update(self, phase: str, match_id: Optional[str], snapshot: Optional[Dict]) -> Optional[LiveEvent]:
+        previous, previous_snapshot = self.phase, self.snapshot
+        self.phase, self.snapshot = phase, snapshot
+        if phase != previous or match_id != self.match_id:
+            self.match_id = match_id
+            self._idle_delay = self.idle_interval
+            return LiveEvent("phase", phase, previous, match_id, snapshot)
+        if snapshot is None or previous_snapshot is None:
+            return None
+        changes = diff(previous_snapshot, snapshot, self.ignore)
+        if not changes:
+            return None
+        return LiveEvent("update", phase, previous, match_id, snapshot, changes)
+
+    def _delay(self) -> float:
+        if self.phase == PREGAME:
+            remaining = (self.snapshot or {}).get("PhaseTimeRemainingNS", 0) / 1e9
+            return min(self.pregame_interval, max(remaining, self.min_interval))
+        if self.phase == INGAME:
+            return self.ingame_interval
+        delay = self._idle_delay
+        self._idle_delay = min(self._idle_delay * 1.5, self.max_idle_interval)
+        return delay
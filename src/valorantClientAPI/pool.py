@@ -0,0 +1,179 @@
+# Spreads requests over several authorized accounts, each with its own
+# Client (and so its own rate limiter), to scale past one account's limits.
+import asyncio
+import itertools
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from .client import Client, Exceptions, error_status
+from .response.mmr import History
+
+STRATEGIES = ("least_loaded", "round_robin")
+# Client methods made of other endpoint calls: run against the pool, so their requests are spread too
+COMPOSED = ("fetch_match_details_many", "iter_leaderboard", "dump_leaderboard")
+# Instrumented Client methods that act on the account itself rather than query an endpoint
+ACCOUNT = ("authorize", "refresh_tokens")
+
+
+class PoolMember:
+    def __init__(self, client: Client, username: str = None, password: str = None):
+        self.client = client
+        self.username = username
+        self.password = password
+        self.in_flight = 0
+        self.requests = 0
+        self.cooldown_until = 0.0
+        self.authorized_at = time.monotonic()
+        self.reauth: Optional[asyncio.Task] = None
+
+    @property
+    def available(self) -> bool:
+        """Not cooling down after a throttle and not being re-authorized."""
+        if self.reauth is not None and not self.reauth.done():
+            return False
+        return self.cooldown_until <= time.monotonic() and not self.client.rate_limiter.throttled()
+
+
+class ClientPool:
+    def __init__(self, strategy: str = "least_loaded", cooldown: float = 30, reauth_interval: float = 3300,
+                 **client_kwargs):
+        """
+        A pool of authorized accounts with the same endpoint methods as Client.
+        Each call goes to one account, picked by `strategy`: "least_loaded" (fewest requests
+        in flight) or "round_robin". An account that got a 429 is left out for `cooldown`
+        seconds, or while its rate limiter is throttled. Accounts added with their credentials
+        are re-authorized in the background every `reauth_interval` seconds, and after a 401.
+        client_kwargs are passed to every Client the pool creates (region, response_cache...),
+        don't pass a shared rate_limiter as each account has its own limits.
+        """
+        if strategy not in STRATEGIES:
+            raise ValueError(f"strategy must be one of {STRATEGIES}")
+        self.strategy = strategy
+        self.cooldown = cooldown
+        self.reauth_interval = reauth_interval
+        self.client_kwargs = client_kwargs
+        self.members: List[PoolMember] = []
+        self._cycle = itertools.count()
+        self._maintenance: Optional[asyncio.Task] = None
+
+    async def add_account(self, username: str, password: str, **client_kwargs) -> Client:
+        """Creates a Client for an account, authorizes it and adds it to the pool."""
+        client = await Client.create(**{**self.client_kwargs, **client_kwargs})
+        await client.authorize(username, password)
+        self.add_client(client, username, password)
+        return client
+
+    def add_client(self, client: Client, username: str = None, password: str = None) -> None:
+        """Adds an already authorized client. Without credentials it is never re-authorized."""
+        self.members.append(PoolMember(client, username, password))
+        self._start()
+
+    def _start(self) -> None:
+        if self._maintenance is not None or self.reauth_interval is None:
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return  # started by the first request instead
+        self._maintenance = asyncio.ensure_future(self._maintain())
+
+    async def close(self) -> None:
+        """Stops background re-authorization and closes every client."""
+        if self._maintenance is not None:
+            self._maintenance.cancel()
+            self._maintenance = None
+        for member in self.members:
+            if member.reauth is not None:
+                member.reauth.cancel()
+            await member.client.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Requests in flight & sent, and availability of every account."""
+        return [
+            {
+                "puuid": member.client.puuid,
+                "in_flight": member.in_flight,
+                "requests": member.requests,
+                "available": member.available,
+            }
+            for member in self.members
+        ]
+
+    def _pick(self) -> PoolMember:
+        if not self.members:
+            raise Exceptions.NotAuthorized("The pool has no accounts, add one with add_account.")
+        self._start()
+        # If every account is unavailable, the least loaded one waits on its own limiter
+        members = [member for member in self.members if member.available] or self.members
+        if self.strategy == "round_robin":
+            return members[next(self._cycle) % len(members)]
+        return min(members, key=lambda member: member.in_flight)
+
+    def _reauthorize(self, member: PoolMember) -> None:
+        if member.username is None or (member.reauth is not None and not member.reauth.done()):
+            return
+
+        async def reauthorize():
+            try:
+                await member.client.authorize(member.username, member.password)
+                member.authorized_at = time.monotonic()
+            except Exception:
+                # Keep it out of rotation for a while and try again on the next check
+                member.cooldown_until = time.monotonic() + self.cooldown
+
+        member.reauth = asyncio.ensure_future(reauthorize())
+
+    async def _maintain(self) -> None:
+        while True:
+            await asyncio.sleep(min(60, self.reauth_interval / 4))
+            now = time.monotonic()
+            for member in self.members:
+                if now - member.authorized_at >= self.reauth_interval:
+                    self._reauthorize(member)
+
+    def _check(self, member: PoolMember, result) -> None:
+        status = error_status(result)
+        if status == 429:
+            member.cooldown_until = time.monotonic() + self.cooldown
+        elif status == 401:
+            self._reauthorize(member)
+
+    def iter_match_history(self, puuid: str = None, *args, **kwargs) -> AsyncIterator[History]:
+        """
+        Client.iter_match_history with its pages spread over the pool. The puuid is required:
+        pages go to different accounts, so "the authorized player" would change between pages.
+        """
+        if puuid is None:
+            raise ValueError("iter_match_history on a pool needs a puuid, the pool has no single authorized player")
+        return Client.iter_match_history(self, puuid, *args, **kwargs)
+
+    def __getattr__(self, name: str):
+        # Only endpoint methods are forwarded: account level ones (authorize, SetTokens,
+        # warmup...) would act on whichever account is picked, use the members' clients for those
+        attr = getattr(Client, name, None)
+        if name in COMPOSED:
+            # Bound to the pool, so every request they make goes through _pick
+            return attr.__get__(self, ClientPool)
+        if not getattr(attr, "instrumented", False) or name in ACCOUNT:
+            raise AttributeError(f"'ClientPool' has no endpoint method '{name}'")
+
+        async def call(*args, **kwargs):
+            member = self._pick()
+            member.in_flight += 1
+            member.requests += 1
+            try:
+                result = await getattr(member.client, name)(*args, **kwargs)
+            finally:
+                member.in_flight -= 1
+            self._check(member, result)
+            return result
+
+        call.__name__ = name
+        call.__doc__ = attr.__doc__
+        return call
@@ -2,7 +2,11 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, get_type_hints
+
+from dataclass_wizard.utils.string_conv import to_snake_case
+
+from ..utils.decoder import converter, decode
 
 
 @dataclass
@@ -157,3 +161,57 @@ class MatchDetails:
     teams: List[Team]
     round_results: List[RoundResults]
     kills: List[Kill]
+
+    def to_columns(self):
+        """Kills & round stats as numpy arrays, see analytics.columns.MatchColumns."""
+        from ..analytics.columns import MatchColumns
+        return MatchColumns.from_matches([self])
+
+
+class LazyMatchDetails:
+    """
+    The match details of a given match_id, built lazily.
+    Keeps the decoded json and only builds a section (kills, round_results, players...)
+    the first time it is read. Reads the same as MatchDetails.
+    """
+    httpStatus = 200
+
+    def __init__(self, data: Dict[str, Any]):
+        self.raw = data
+        self._keys = {to_snake_case(key): key for key in data}
+
+    def __getattr__(self, name: str):
+        # Only called for sections that haven't been built yet
+        convert = _lazy_sections().get(name, _MISSING)
+        if convert is _MISSING:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        value = self.raw.get(self._keys.get(name))
+        if value is not None and convert is not None:
+            value = convert(value)
+        setattr(self, name, value)
+        return value
+
+    def __repr__(self) -> str:
+        match_id = (self.raw.get(self._keys.get("match_info")) or {}).get("matchId")
+        return f"{type(self).__name__}(match_id={match_id!r})"
+
+    def to_columns(self):
+        """Kills & round stats as numpy arrays, see analytics.columns.MatchColumns."""
+        from ..analytics.columns import MatchColumns
+        return MatchColumns.from_matches([self])
+
+    def to_model(self) -> MatchDetails:
+        """Builds the full MatchDetails."""
+        return decode(MatchDetails, self.raw)
+
+
+_MISSING = object()
+_sections: Optional[Dict[str, Any]] = None
+
+
+def _lazy_sections() -> Dict[str, Any]:
+    global _sections
+    if _sections is None:
+        hints = get_type_hints(MatchDetails)
+        _sections = {name: converter(tp) for name, tp in hints.items() if name != "httpStatus"}
+    return _sections
@@ -1,18 +1,28 @@
 # Sourced from https://github.com/tuna-tuna/python-riot-auth/blob/main/riot_auth/auth.py
 # Original author https://github.com/floxay/python-riot-auth
 
+import asyncio
 import ctypes
 import json
 import ssl
 import sys
 import warnings
+import weakref
 from base64 import urlsafe_b64decode
 from secrets import token_urlsafe
 from typing import Dict, List, Optional, Sequence, Tuple, Union
 from urllib.parse import parse_qsl, urlsplit
 
 import aiohttp
-import requests
+
+from .utils import version
+
+# Connections to auth.riotgames.com & entitlements.auth.riotgames.com are pooled
+# per event loop and shared by every RiotAuth, see get_auth_connector()
+AUTH_CONNECTION_LIMIT = 20
+AUTH_KEEPALIVE_TIMEOUT = 60
+_auth_ssl_ctx: Optional[ssl.SSLContext] = None
+_auth_connectors: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.TCPConnector]" = weakref.WeakKeyDictionary()
 
 
 class Exceptions:
@@ -85,8 +95,10 @@ class RiotAuth:
         )
     )
 
-    def __init__(self) -> None:
-        self._auth_ssl_ctx = RiotAuth.create_riot_auth_ssl_ctx()
+    def __init__(self, riot_client_build: Optional[str] = None,
+                 trace_configs: Optional[List[aiohttp.TraceConfig]] = None) -> None:
+        self._auth_ssl_ctx = get_auth_ssl_ctx()
+        self.trace_configs = trace_configs
         self._cookie_jar = aiohttp.CookieJar()
         self.access_token: Optional[str] = None
         self.scope: Optional[str] = None
@@ -95,7 +107,9 @@ class RiotAuth:
         self.expires_at: int = 0
         self.user_id: Optional[str] = None
         self.entitlements_token: Optional[str] = None
-        self.RIOT_CLIENT_USER_AGENT = f"RiotClient/{get_user_agent()} %s (Windows;10;;Professional, x64)"
+        if riot_client_build is None:
+            riot_client_build = get_user_agent()
+        self.RIOT_CLIENT_USER_AGENT = f"RiotClient/{riot_client_build} %s (Windows;10;;Professional, x64)"
 
     @staticmethod
     def create_riot_auth_ssl_ctx() -> ssl.SSLContext:
@@ -179,9 +193,10 @@ class RiotAuth:
         if username and password:
             self._cookie_jar.clear()
 
-        conn = aiohttp.TCPConnector(ssl=self._auth_ssl_ctx)
+        # The session only holds this account's cookies, connections come from the shared pool
         async with aiohttp.ClientSession(
-            connector=conn, raise_for_status=True, cookie_jar=self._cookie_jar
+            connector=get_auth_connector(), connector_owner=False, raise_for_status=True, cookie_jar=self._cookie_jar,
+            trace_configs=self.trace_configs,
         ) as session:
             headers = {
                 "Accept-Encoding": "deflate, gzip, zstd",
@@ -214,6 +229,10 @@ class RiotAuth:
             # endregion
 
             if resp_type != "response":  # not reauth
+                if not (username and password):
+                    raise Exceptions.RiotAuthenticationError(
+                        "Failed to reauthenticate with cookies, they are missing or expired."
+                    )
                 # region Authenticate
                 body = {
                     "language": "en_US",
@@ -268,14 +287,34 @@ class RiotAuth:
 
             return 'Success'
 
+    async def reauthorize(self) -> bool:
+        """
+        Gets new tokens with the cookies of a previous login, without the password.
+        Returns False if the cookies are missing or expired.
+        """
+        if len(self._cookie_jar) == 0:
+            return False
+        try:
+            return await self.authorize("", "") == 'Success'
+        except (Exceptions.RiotAuthenticationError, aiohttp.ClientResponseError):
+            return False
+
+    def save_cookies(self, path: str) -> None:
+        """Saves the cookie jar, so a later process can reauthorize() without the password."""
+        self._cookie_jar.save(path)
+
+    def load_cookies(self, path: str) -> None:
+        self._cookie_jar.load(path)
+
     async def mfa(self, mfaCode: str) -> str:
         """
         Send MFA Code
         
         """
-        conn = aiohttp.TCPConnector(ssl=self._auth_ssl_ctx)
+        # The session only holds this account's cookies, connections come from the shared pool
         async with aiohttp.ClientSession(
-            connector=conn, raise_for_status=True, cookie_jar=self._cookie_jar
+            connector=get_auth_connector(), connector_owner=False, raise_for_status=True, cookie_jar=self._cookie_jar,
+            trace_configs=self.trace_configs,
         ) as session:
             headers = {
                 "Accept-Encoding": "deflate, gzip, zstd",
@@ -322,7 +361,32 @@ class RiotAuth:
 
             return 'Success' 
 
+def get_auth_ssl_ctx() -> ssl.SSLContext:
+    """The hardened auth SSL context, built once per process."""
+    global _auth_ssl_ctx
+    if _auth_ssl_ctx is None:
+        _auth_ssl_ctx = RiotAuth.create_riot_auth_ssl_ctx()
+    return _auth_ssl_ctx
+
+
+def get_auth_connector() -> aiohttp.TCPConnector:
+    """The running loop's pooled connector for auth requests, created on first use."""
+    loop = asyncio.get_running_loop()
+    connector = _auth_connectors.get(loop)
+    if connector is None or connector.closed:
+        connector = aiohttp.TCPConnector(
+            ssl=get_auth_ssl_ctx(), limit=AUTH_CONNECTION_LIMIT, keepalive_timeout=AUTH_KEEPALIVE_TIMEOUT
+        )
+        _auth_connectors[loop] = connector
+    return connector
+
+
+async def close_auth_connector() -> None:
+    """Closes the running loop's pooled auth connections, e.g. on shutdown."""
+    connector = _auth_connectors.pop(asyncio.get_running_loop(), None)
+    if connector is not None:
+        await connector.close()
+
+
 def get_user_agent():
-    response = requests.get("https://valorant-api.com/v1/version")
-    version_data = response.json()
-    return version_data['data']['riotClientBuild']
\ No newline at end of file
+    return version.get_riot_client_build()
\ No newline at end of file
@@ -0,0 +1,117 @@
+# Helpers to run many requests concurrently & stream the results back.
+import asyncio
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, List, Optional
+
+from ..response.errors import httpStatusError
+
+
+@dataclass
+class BatchResult:
+    """Result of one item of a batch. `error` is set instead of `result` if it failed."""
+    key: Any
+    result: Any = None
+    error: Optional[Any] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+_DONE = object()
+
+
+async def stream(items: Iterable, fetch: Callable[[Any], Awaitable], concurrency: int = 10) -> AsyncIterator[BatchResult]:
+    """
+    Calls `fetch(item)` for every item with at most `concurrency` calls in flight,
+    yielding a BatchResult as each one completes.
+    At most `concurrency` results are buffered, so a slow consumer pauses the fetching.
+    Failures (exceptions or httpStatusError responses) are reported per item,
+    an exception raised by `items` itself stops the stream and is raised.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=concurrency)
+    items = iter(items)
+
+    async def worker():
+        try:
+            for item in items:
+                try:
+                    result = await fetch(item)
+                except Exception as err:
+                    await queue.put(BatchResult(item, error=err))
+                    continue
+                if isinstance(result, httpStatusError):
+                    await queue.put(BatchResult(item, error=result))
+                else:
+                    await queue.put(BatchResult(item, result))
+        except Exception as err:
+            # Only `items` can get here, fetch errors are reported per item
+            await queue.put(err)
+            return
+        await queue.put(_DONE)
+
+    workers = [asyncio.ensure_future(worker()) for _ in range(concurrency)]
+    running = len(workers)
+    try:
+        while running:
+            result = await queue.get()
+            if result is _DONE:
+                running -= 1
+            elif isinstance(result, Exception):
+                raise result
+            else:
+                yield result
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+
+async def ordered(items: Iterable, fetch: Callable[[Any], Awaitable], window: int = 4) -> AsyncIterator:
+    """
+    Calls `fetch(item)` for every item with up to `window` calls in flight,
+    yielding the results in the order of `items`. Exceptions are raised in order too.
+    """
+    items = iter(items)
+    pending = deque()
+    try:
+        while True:
+            while len(pending) < max(window, 1):
+                item = next(items, _DONE)
+                if item is _DONE:
+                    break
+                pending.append(asyncio.ensure_future(fetch(item)))
+            if not pending:
+                return
+            yield await pending.popleft()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def paged(fetch: Callable[[int], Awaitable], entries: Callable[[Any], List], total: Callable[[Any], int],
+                page_size: int, window: int = 4, max_items: int = None) -> AsyncIterator:
+    """
+    Yields the entries of a paged endpoint in order, `fetch(start)` getting the page at `start`.
+    The first page gives the total, then up to `window` following pages are fetched while the
+    current one is being consumed. Stops at the total, `max_items` or the first empty page.
+    """
+    page = await fetch(0)
+    end = total(page) if max_items is None else min(total(page), max_items)
+    pages = ordered(range(page_size, end, page_size), fetch, window)
+    count = 0
+    try:
+        while True:
+            for entry in entries(page):
+                if count >= end:
+                    return
+                count += 1
+                yield entry
+            page = await pages.__anext__()
+            if not entries(page):
+                return
+    except StopAsyncIteration:
+        return
+    finally:
+        await pages.aclose()
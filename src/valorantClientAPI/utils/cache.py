@@ -0,0 +1,178 @@
+# In-memory caches & the response cache used by Client.
+import asyncio
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Hashable, List, Optional
+
+_MISSING = object()
+
+
+class TTLCache:
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None):
+        """LRU cache of at most `maxsize` entries, each expiring `ttl` seconds after it was set (never if None)."""
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.get(key, _MISSING)
+        if entry is _MISSING:
+            return default
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = _MISSING) -> None:
+        if ttl is _MISSING:
+            ttl = self.ttl
+        self._data[key] = (value, None if ttl is None else time.monotonic() + ttl)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.pop(key, _MISSING)
+        return default if entry is _MISSING else entry[0]
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+# Seconds each slow-changing endpoint is cached for
+DEFAULT_TTLS: Dict[str, float] = {
+    "Content_FetchContent": 6 * 3600,
+    "Config_FetchConfig": 3600,
+    "Store_GetOffers": 3600,
+    "ItemProgressionDefinitionsV2_Fetch": 6 * 3600,
+}
+
+
+@dataclass
+class CacheEntry:
+    data: Any
+    expires_at: float
+    client_version: Optional[str] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+
+class MemoryBackend:
+    """Keeps entries in a bounded in-memory LRU."""
+    def __init__(self, maxsize: int = 256):
+        self._cache = TTLCache(maxsize)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        return self._cache.get(key)
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        self._cache.set(key, entry)
+
+    def delete(self, key: str) -> None:
+        self._cache.pop(key)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+
+class DiskBackend:
+    """Keeps entries as json files in a directory, so they survive restarts."""
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+
+    def _file(self, key: str) -> str:
+        return os.path.join(self.path, hashlib.sha1(key.encode()).hexdigest() + ".json")
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        try:
+            with open(self._file(key), "r", encoding="utf-8") as file:
+                return CacheEntry(**json.load(file))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        file_path = self._file(key)
+        with open(file_path + ".tmp", "w", encoding="utf-8") as file:
+            json.dump(asdict(entry), file)
+        os.replace(file_path + ".tmp", file_path)
+
+    def delete(self, key: str) -> None:
+        try:
+            os.remove(self._file(key))
+        except OSError:
+            pass
+
+    def clear(self) -> None:
+        for name in os.listdir(self.path):
+            if name.endswith(".json"):
+                os.remove(os.path.join(self.path, name))
+
+
+class ResponseCache:
+    def __init__(self, ttls: Dict[str, float] = None, maxsize: int = 256, path: str = None, backends: List = None):
+        """
+        Caches responses of the endpoints in `ttls` (endpoint name -> seconds).
+        Entries live in a bounded in-memory LRU, and also on disk in `path` if given.
+        Pass `backends` to use your own, anything with get/set/delete/clear works.
+        Entries stored under another client version are ignored.
+        """
+        self.ttls = dict(DEFAULT_TTLS) if ttls is None else ttls
+        if backends is None:
+            backends = [MemoryBackend(maxsize)]
+            if path is not None:
+                backends.append(DiskBackend(path))
+        self.backends = backends
+
+    def ttl(self, endpoint: str) -> Optional[float]:
+        return self.ttls.get(endpoint)
+
+    async def get(self, key: str, client_version: str = None) -> Optional[CacheEntry]:
+        """Gets an entry (fresh or stale) for the given client version."""
+        for index, backend in enumerate(self.backends):
+            entry = await _call(backend, backend.get, key)
+            if entry is None:
+                continue
+            if entry.client_version != client_version:
+                await self.delete(key)
+                return None
+            # Promote entries found in slower backends
+            for faster in self.backends[:index]:
+                await _call(faster, faster.set, key, entry)
+            return entry
+        return None
+
+    async def set(self, key: str, entry: CacheEntry) -> None:
+        for backend in self.backends:
+            await _call(backend, backend.set, key, entry)
+
+    async def delete(self, key: str) -> None:
+        for backend in self.backends:
+            await _call(backend, backend.delete, key)
+
+    async def clear(self) -> None:
+        for backend in self.backends:
+            await _call(backend, backend.clear)
+
+
+async def _call(backend, func, *args):
+    # Disk access runs in a thread so it does not block the event loop
+    if isinstance(backend, MemoryBackend):
+        return func(*args)
+    return await asyncio.get_running_loop().run_in_executor(None, func, *args)
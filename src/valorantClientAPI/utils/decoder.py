@@ -0,0 +1,185 @@
+# Fast loaders for the response dataclasses.
+# A loader is compiled once per class: json keys are mapped to fields and each
+# field gets its converter (nested dataclass, list, enum...) up front, so decoding
+# does no per-field type inspection. Values are coerced like dataclass_wizard does,
+# and any failure falls back to dataclass_wizard's fromdict for its error reporting.
+import dataclasses
+import typing
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Callable, Dict, Optional, Tuple, Type, TypeVar
+
+from dataclass_wizard import fromdict
+from dataclass_wizard.utils.string_conv import to_snake_case
+from dataclass_wizard.utils.type_conv import as_date, as_datetime
+
+T = TypeVar("T")
+Converter = Optional[Callable[[Any], Any]]
+
+_TRUTHY = frozenset(("true", "t", "yes", "y", "on", "1"))
+_SKIP = (None, None)
+_loaders: Dict[type, Callable[[Dict], Any]] = {}
+
+
+def _to_str(value):
+    if type(value) is str:
+        return value
+    return "" if value is None else str(value)
+
+
+# Same coercions as dataclass_wizard's as_int & float loader
+def _to_int(value):
+    t = type(value)
+    if t is int:
+        return value
+    if t is bool:
+        raise TypeError(f"Incorrect type for int: {value!r}")
+    if t is float:
+        return int(round(value))
+    if t is str and "." in value:
+        return int(round(float(value)))
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        if not value:
+            return 0
+        raise
+
+
+def _to_float(value):
+    if type(value) is float:
+        return value
+    return float(value)
+
+
+def _to_bool(value):
+    if type(value) is bool:
+        return value
+    if isinstance(value, str):
+        return value.strip().lower() in _TRUTHY
+    return bool(value)
+
+
+_PRIMITIVES = {str: _to_str, int: _to_int, float: _to_float, bool: _to_bool}
+
+
+# Lists & dicts of primitives are nearly always already of the right type,
+# in which case they are used as they are instead of being copied.
+def _typed_list(tp: type, inner: Callable) -> Callable:
+    def convert(value):
+        for item in value:
+            if type(item) is not tp:
+                return [inner(item) for item in value]
+        return value
+    return convert
+
+
+def _typed_dict(tp: type, inner: Callable) -> Callable:
+    def convert(value):
+        for item in value.values():
+            if type(item) is not tp:
+                return {key: inner(item) for key, item in value.items()}
+        return value
+    return convert
+
+
+def converter(tp) -> Converter:
+    """Gets the converter of an annotation, None if values are used as they are."""
+    if tp in _PRIMITIVES:
+        return _PRIMITIVES[tp]
+    if dataclasses.is_dataclass(tp):
+        return loader(tp)
+    if isinstance(tp, type) and issubclass(tp, Enum):
+        return tp
+    if tp is datetime:
+        return as_datetime
+    if tp is date:
+        return as_date
+
+    origin = typing.get_origin(tp)
+    args = typing.get_args(tp)
+    if origin is typing.Union:
+        non_none = [arg for arg in args if arg is not type(None)]
+        if len(non_none) != 1:
+            return None
+        inner = converter(non_none[0])
+        if inner is None:
+            return None
+        return lambda value: None if value is None else inner(value)
+    if origin in (list, tuple, set, frozenset):
+        inner = converter(args[0]) if args else None
+        if inner is None:
+            return None if origin is list else origin
+        if origin is tuple and len(args) > 1 and args[1] is not Ellipsis:
+            return None
+        if origin is list:
+            if args[0] in _PRIMITIVES:
+                return _typed_list(args[0], inner)
+            return lambda value: [inner(item) for item in value]
+        return lambda value: origin(inner(item) for item in value)
+    if origin is dict:
+        inner = converter(args[1]) if len(args) == 2 else None
+        if inner is None:
+            return None
+        if args[1] in _PRIMITIVES:
+            return _typed_dict(args[1], inner)
+        return lambda value: {key: inner(item) for key, item in value.items()}
+    # Any, None & unparameterized Dict/List are used as they are
+    return None
+
+
+def _compile(cls: Type[T]) -> Callable[[Dict], T]:
+    hints = typing.get_type_hints(cls)
+    fields = [field for field in dataclasses.fields(cls) if field.init]
+    specs: Dict[str, Tuple[str, Converter]] = {}
+    by_snake: Dict[str, str] = {}
+
+    def load(data: Dict) -> T:
+        try:
+            kwargs = {}
+            for key, value in data.items():
+                spec = keymap.get(key)
+                if spec is None:
+                    spec = _resolve(key)
+                name, convert = spec
+                if name is None:
+                    continue
+                kwargs[name] = value if convert is None else convert(value)
+            return cls(**kwargs)
+        except Exception:
+            # Let dataclass_wizard raise its detailed ParseError/MissingFields
+            return fromdict(cls, data)
+
+    # Registered before the fields are compiled so self-referencing classes resolve to it
+    _loaders[cls] = load
+    for field in fields:
+        convert = converter(hints.get(field.name, Any))
+        specs[field.name] = (field.name, convert)
+        by_snake[field.name.lower()] = field.name
+
+    keymap: Dict[str, Tuple[str, Converter]] = dict(specs)
+
+    def _resolve(key: str) -> Tuple[str, Converter]:
+        # Same lookup as dataclass_wizard: snake_case the key, then match it case-insensitively
+        name = by_snake.get(to_snake_case(key).lower())
+        spec = _SKIP if name is None else specs[name]
+        keymap[key] = spec
+        return spec
+
+    return load
+
+
+def loader(cls: Type[T]) -> Callable[[Dict], T]:
+    """Gets the compiled loader of a dataclass, compiling it on first use."""
+    load = _loaders.get(cls)
+    if load is None:
+        load = _compile(cls)
+    return load
+
+
+def decode(cls: Type[T], data: Dict) -> T:
+    """Drop-in replacement for dataclass_wizard's fromdict(cls, data)."""
+    load = _loaders.get(cls)
+    if load is None:
+        load = _compile(cls)
+    return load(data)
@@ -0,0 +1,59 @@
+# Json decoding of response bodies. Uses orjson or ujson when one is installed
+# (several times faster than the standard library on big match & leaderboard
+# payloads) and falls back to the standard json module otherwise.
+import json
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover
+    ujson = None
+
+JSON_MEDIA_TYPES = ("application/json", "text/json", "text/plain", "text/javascript", "application/javascript")
+
+
+def _decoders():
+    decoders = {"json": json.loads}
+    if ujson is not None:
+        decoders["ujson"] = ujson.loads
+    if orjson is not None:
+        decoders["orjson"] = orjson.loads
+    return decoders
+
+
+DECODERS = _decoders()
+name = "orjson" if "orjson" in DECODERS else "ujson" if "ujson" in DECODERS else "json"
+loads: Callable[[Union[bytes, str]], Any] = DECODERS[name]
+
+
+def configure(decoder: Union[str, Callable[[Union[bytes, str]], Any]]) -> None:
+    """Sets the process-wide decoder: "orjson", "ujson", "json" or any callable taking bytes."""
+    global name, loads
+    if callable(decoder):
+        name, loads = getattr(decoder, "__module__", None) or "custom", decoder
+    elif decoder in DECODERS:
+        name, loads = decoder, DECODERS[decoder]
+    else:
+        raise ValueError(f"json decoder {decoder!r} is not installed, available: {', '.join(DECODERS)}")
+
+
+def is_json(content_type: Optional[str]) -> bool:
+    """Whether a response with this Content-Type holds json.
+    Parameters & case are ignored and a missing type is assumed to be json.
+    """
+    if not content_type:
+        return True
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    return media_type in JSON_MEDIA_TYPES or media_type.endswith("+json") or media_type == "application/octet-stream"
+
+
+def decode(body: Union[bytes, str]) -> Any:
+    """Decodes a json body, None for an empty one."""
+    if not body or body.isspace():
+        return None
+    return loads(body)
@@ -3,17 +3,131 @@
 # As a rule of thumb, use 100 requests per second.
 import asyncio
 import time
+import weakref
+from collections import deque
+from typing import Dict, Tuple
+from urllib.parse import urlsplit
+
+# Rates per host family as (calls, period in seconds)
+DEFAULT_RATES: Dict[str, Tuple[int, float]] = {
+    "pd": (100, 1),
+    "glz": (100, 1),
+    "shared": (100, 1),
+    "auth": (10, 1),
+    "other": (100, 1),
+}
+
+
+def host_family(url: str) -> str:
+    """Gets the rate limit family of a request url."""
+    host = urlsplit(url).hostname or ""
+    if host.startswith("pd."):
+        return "pd"
+    elif host.startswith("glz-"):
+        return "glz"
+    elif host.startswith("shared."):
+        return "shared"
+    elif host.endswith("auth.riotgames.com"):
+        return "auth"
+    return "other"
+
+
+class TokenBucket:
+    def __init__(self, calls_limit: int = 100, period: float = 1):
+        """Allows bursts of up to `calls_limit` calls, refilled at `calls_limit / period` per second."""
+        self.capacity = float(calls_limit)
+        self.rate = calls_limit / period
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        # One lock per event loop, so a limiter shared across loops (e.g. several asyncio.run calls) works
+        self._locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = weakref.WeakKeyDictionary()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def throttle(self, seconds: float) -> None:
+        """Empties the bucket so no tokens are handed out for `seconds`, e.g. after a 429."""
+        self._refill()
+        self.tokens = min(self.tokens, -seconds * self.rate)
+
+    def level(self) -> float:
+        """Current number of available tokens, negative while throttled."""
+        self._refill()
+        return self.tokens
+
+    def try_acquire(self, tokens: float = 1) -> bool:
+        """Takes tokens without waiting, returns False if there are not enough."""
+        self._refill()
+        if self.tokens >= tokens:
+            self.tokens -= tokens
+            return True
+        return False
+
+    async def acquire(self, tokens: float = 1) -> float:
+        """Waits until tokens are available and takes them. Returns the seconds waited."""
+        loop = asyncio.get_running_loop()
+        lock = self._locks.get(loop)
+        if lock is None:
+            lock = self._locks[loop] = asyncio.Lock()
+        if not lock.locked() and self.try_acquire(tokens):
+            return 0.0
+
+        start = time.monotonic()
+        # Waiters queue on the lock so they are served in order.
+        async with lock:
+            while not self.try_acquire(tokens):
+                await asyncio.sleep((tokens - self.tokens) / self.rate)
+        return time.monotonic() - start
+
+
+class RateLimiter:
+    def __init__(self, rates: Dict[str, Tuple[int, float]] = None):
+        """
+        Token buckets keyed by host family (pd, glz, shared, auth, other).
+        One limiter can be shared between several clients so they share their budget.
+        """
+        self.rates = dict(DEFAULT_RATES)
+        if rates is not None:
+            self.rates.update(rates)
+        self.buckets: Dict[str, TokenBucket] = {
+            family: TokenBucket(*rate) for family, rate in self.rates.items()
+        }
+
+    def bucket(self, family: str) -> TokenBucket:
+        if family not in self.buckets:
+            self.buckets[family] = TokenBucket(*self.rates.get(family, self.rates["other"]))
+        return self.buckets[family]
+
+    async def acquire(self, family: str = "other", tokens: float = 1) -> float:
+        """Waits for the family's budget. Returns the seconds waited."""
+        return await self.bucket(family).acquire(tokens)
+
+    def throttle(self, family: str, seconds: float) -> None:
+        """Pauses every request of a host family for `seconds`."""
+        self.bucket(family).throttle(seconds)
+
+    def levels(self) -> Dict[str, float]:
+        """Current fill level of every bucket."""
+        return {family: bucket.level() for family, bucket in self.buckets.items()}
+
+    def throttled(self) -> bool:
+        """Whether any host family is paused by throttle()."""
+        return any(bucket.level() < 0 for bucket in self.buckets.values())
+
 
 class Limiter:
+    """Per-function limiter decorator, kept for backwards compatibility. Prefer RateLimiter."""
     def __init__(self, calls_limit: int = 100, period: int = 1):
         self.calls_limit = calls_limit
         self.period = period
         self.semaphore = asyncio.Semaphore(calls_limit)
-        self.requests_finish_time = []
+        self.requests_finish_time = deque()
 
     async def sleep(self):
         if len(self.requests_finish_time) >= self.calls_limit:
-            sleep_before = self.requests_finish_time.pop(0)
+            sleep_before = self.requests_finish_time.popleft()
             if sleep_before >= time.monotonic():
                 await asyncio.sleep(sleep_before - time.monotonic())
 
@@ -26,4 +140,4 @@ class Limiter:
 
             return res
 
-        return wrapper
\ No newline at end of file
+        return wrapper
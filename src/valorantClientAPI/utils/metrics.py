@@ -0,0 +1,183 @@
+# Per-endpoint request metrics. Endpoint methods are wrapped by `instrumented`,
+# which only does work when the client has a Metrics or a Tracer instance; the request
+# path adds its timings to the call being recorded through the `current_call` context var.
+import functools
+import logging
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+PHASES = ("total", "limiter_wait", "network", "parse")
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CallRecord:
+    """
+    One endpoint call. Times are in seconds: limiter_wait is spent waiting for the rate
+    limiter, network sending requests & reading bodies (retries included), parse decoding
+    json & building dataclasses. status & host are those of the last request, None when the
+    call was answered without one (e.g. from a cache).
+    """
+    endpoint: str
+    host: Optional[str] = None
+    status: Optional[int] = None
+    requests: int = 0
+    total: float = 0.0
+    limiter_wait: float = 0.0
+    network: float = 0.0
+    parse: float = 0.0
+    bytes: int = 0
+    error: Optional[str] = None
+
+
+current_call: ContextVar[Optional[CallRecord]] = ContextVar("current_call", default=None)
+
+
+class Histogram:
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """(le, count) pairs as exported by Prometheus, ending with +Inf."""
+        total = 0
+        pairs = []
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            pairs.append(("+Inf" if bound == float("inf") else repr(bound), total))
+        return pairs
+
+
+class EndpointMetrics:
+    def __init__(self, buckets: Sequence[float]):
+        self.statuses: Dict[str, int] = {}
+        self.errors = 0
+        self.bytes = 0
+        self.latency = {phase: Histogram(buckets) for phase in PHASES}
+
+
+class Metrics:
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS, prefix: str = "valorant_client"):
+        """
+        Aggregates CallRecords per (endpoint, host): calls per status, errors, bytes received
+        and latency histograms of each phase. Can be shared by several clients.
+        """
+        self.buckets = tuple(buckets)
+        self.prefix = prefix
+        self.endpoints: Dict[Tuple[str, str], EndpointMetrics] = {}
+        self.observers: List[Callable[[CallRecord], None]] = []
+
+    def subscribe(self, observer: Callable[[CallRecord], None]) -> None:
+        """Calls `observer` with the CallRecord of every finished endpoint call. Its errors are logged, not raised."""
+        self.observers.append(observer)
+
+    def unsubscribe(self, observer: Callable[[CallRecord], None]) -> None:
+        self.observers.remove(observer)
+
+    def record(self, call: CallRecord) -> None:
+        key = (call.endpoint, call.host or "")
+        metrics = self.endpoints.get(key)
+        if metrics is None:
+            metrics = self.endpoints[key] = EndpointMetrics(self.buckets)
+        status = "none" if call.status is None else str(call.status)
+        metrics.statuses[status] = metrics.statuses.get(status, 0) + 1
+        if call.error is not None:
+            metrics.errors += 1
+        metrics.bytes += call.bytes
+        for phase in PHASES:
+            metrics.latency[phase].observe(getattr(call, phase))
+        for observer in self.observers:
+            # Metrics must never break the call being recorded
+            try:
+                observer(call)
+            except Exception:
+                logger.exception("metrics observer %r failed", observer)
+
+    def reset(self) -> None:
+        self.endpoints.clear()
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """Totals per "endpoint host": statuses, errors, bytes and count/sum of every phase."""
+        return {
+            f"{endpoint} {host}".strip(): {
+                "statuses": dict(metrics.statuses),
+                "errors": metrics.errors,
+                "bytes": metrics.bytes,
+                "latency": {
+                    phase: {"count": histogram.count, "sum": histogram.sum}
+                    for phase, histogram in metrics.latency.items()
+                },
+            }
+            for (endpoint, host), metrics in self.endpoints.items()
+        }
+
+    def prometheus(self) -> str:
+        """The metrics in the Prometheus text exposition format."""
+        prefix = self.prefix
+        lines = [
+            f"# HELP {prefix}_calls_total Endpoint calls by status of their last response.",
+            f"# TYPE {prefix}_calls_total counter",
+        ]
+        for (endpoint, host), metrics in self.endpoints.items():
+            for status, count in metrics.statuses.items():
+                lines.append(f'{prefix}_calls_total{{endpoint="{endpoint}",host="{host}",status="{status}"}} {count}')
+        lines += [f"# HELP {prefix}_errors_total Endpoint calls that raised.", f"# TYPE {prefix}_errors_total counter"]
+        for (endpoint, host), metrics in self.endpoints.items():
+            lines.append(f'{prefix}_errors_total{{endpoint="{endpoint}",host="{host}"}} {metrics.errors}')
+        lines += [f"# HELP {prefix}_response_bytes_total Response bytes received.", f"# TYPE {prefix}_response_bytes_total counter"]
+        for (endpoint, host), metrics in self.endpoints.items():
+            lines.append(f'{prefix}_response_bytes_total{{endpoint="{endpoint}",host="{host}"}} {metrics.bytes}')
+        lines += [
+            f"# HELP {prefix}_call_seconds Endpoint call time by phase (total, limiter_wait, network, parse).",
+            f"# TYPE {prefix}_call_seconds histogram",
+        ]
+        for (endpoint, host), metrics in self.endpoints.items():
+            for phase, histogram in metrics.latency.items():
+                labels = f'endpoint="{endpoint}",host="{host}",phase="{phase}"'
+                for le, count in histogram.cumulative():
+                    lines.append(f'{prefix}_call_seconds_bucket{{{labels},le="{le}"}} {count}')
+                lines.append(f"{prefix}_call_seconds_sum{{{labels}}} {histogram.sum}")
+                lines.append(f"{prefix}_call_seconds_count{{{labels}}} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+
+def instrumented(func):
+    """
+    Records the calls of a Client endpoint method in the client's `metrics`, if it has one.
+    With a `tracer` the call is only made current, so its requests are tagged with the endpoint.
+    """
+    name = func.__name__
+
+    @functools.wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        metrics = self.metrics
+        if metrics is None and self.tracer is None:
+            return await func(self, *args, **kwargs)
+        call = CallRecord(name)
+        token = current_call.set(call)
+        start = time.perf_counter()
+        try:
+            return await func(self, *args, **kwargs)
+        except BaseException as err:
+            call.error = type(err).__name__
+            raise
+        finally:
+            call.total = time.perf_counter() - start
+            current_call.reset(token)
+            if metrics is not None:
+                metrics.record(call)
+
+    wrapper.instrumented = True
+    return wrapper
@@ -0,0 +1,107 @@
+# Batched & cached puuid -> (game_name, tag_line) resolution through the name-service.
+import asyncio
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .cache import TTLCache
+
+Name = Tuple[str, str]
+
+_MISSING = object()
+
+
+class NameResolver:
+    def __init__(self, client, window: float = 0.01, chunk_size: int = 100, maxsize: int = 10000, ttl: float = 3600,
+                 region: str = None):
+        """
+        Lookups made within `window` seconds of each other, from any coroutine, are sent
+        together in name-service calls of at most `chunk_size` puuids.
+        Resolved names, and puuids the name-service doesn't know (as None), are kept in an
+        LRU cache of `maxsize` entries for `ttl` seconds, and a puuid already being looked up
+        is not requested again.
+        Lookups go to the name-service of `region` unless they pass their own.
+        """
+        self.client = client
+        self.window = window
+        self.chunk_size = chunk_size
+        self.region = region
+        self.cache = TTLCache(maxsize, ttl)
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._queues: Dict[Optional[str], List[str]] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        # The event loop only keeps weak references to tasks
+        self._fetches: Set[asyncio.Task] = set()
+
+    async def resolve(self, puuid: str, region: str = None) -> Optional[Name]:
+        """Gets the (game_name, tag_line) of a puuid, None if the name-service doesn't know it."""
+        return (await self.resolve_many([puuid], region)).get(puuid)
+
+    async def resolve_many(self, puuids: Iterable[str], region: str = None) -> Dict[str, Optional[Name]]:
+        """Gets the (game_name, tag_line) of every puuid."""
+        if region is None:
+            region = self.region
+        names = {}
+        waiting = {}
+        for puuid in puuids:
+            if puuid in names or puuid in waiting:
+                continue
+            name = self.cache.get(puuid, _MISSING)
+            if name is not _MISSING:
+                names[puuid] = name
+            else:
+                waiting[puuid] = self._lookup(puuid, region)
+
+        if waiting:
+            results = await asyncio.gather(*waiting.values())
+            names.update(zip(waiting, results))
+        return names
+
+    def _lookup(self, puuid: str, region: Optional[str]) -> asyncio.Future:
+        future = self._pending.get(puuid)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[puuid] = future
+            queue = self._queues.setdefault(region, [])
+            queue.append(puuid)
+            if len(queue) >= self.chunk_size:
+                self._flush()
+            elif self._flush_handle is None:
+                self._flush_handle = loop.call_later(self.window, self._flush)
+        return future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        queues, self._queues = self._queues, {}
+        for region, queue in queues.items():
+            for start in range(0, len(queue), self.chunk_size):
+                task = asyncio.ensure_future(self._fetch(queue[start:start + self.chunk_size], region))
+                self._fetches.add(task)
+                task.add_done_callback(self._fetches.discard)
+
+    async def _fetch(self, puuids: List[str], region: Optional[str]) -> None:
+        try:
+            data = await self.client.get_username_from_ids(region=region, puuids=puuids)
+            if not isinstance(data, list):
+                raise ValueError(f"Unexpected name-service response: {data}")
+        except Exception as err:
+            for puuid in puuids:
+                future = self._pending.pop(puuid)
+                if not future.done():
+                    future.set_exception(err)
+            return
+
+        for player in data:
+            puuid = player.get("Subject")
+            name = (player.get("GameName"), player.get("TagLine"))
+            self.cache.set(puuid, name)
+            future = self._pending.pop(puuid, None)
+            if future is not None and not future.done():
+                future.set_result(name)
+        for puuid in puuids:
+            future = self._pending.pop(puuid, None)
+            if future is not None:
+                self.cache.set(puuid, None)
+                if not future.done():
+                    future.set_result(None)
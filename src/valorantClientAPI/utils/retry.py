@@ -0,0 +1,62 @@
+# Retry policy for throttled (429), unavailable (5xx) and reset requests.
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+from .limiter import TokenBucket
+
+RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parses a Retry-After header, either in seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+class RetryPolicy:
+    def __init__(self, max_retries: int = 3, base_delay: float = 0.5, max_delay: float = 30,
+                 budget: int = 50, budget_period: float = 60):
+        """
+        max_retries: retries allowed for a single request.
+        base_delay & max_delay: bounds of the jittered exponential backoff, in seconds.
+        A Retry-After longer than max_delay is not waited for, the response is returned instead.
+        budget & budget_period: retries allowed across all requests, so an outage
+        does not turn into a retry storm.
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = TokenBucket(budget, budget_period)
+
+    def backoff(self, attempt: int) -> float:
+        """Upper bound of the backoff before retry number `attempt + 1`, in seconds."""
+        return min(self.max_delay, self.base_delay * 2 ** attempt)
+
+    def next_delay(self, attempt: int, retry_after: float = None, max_retries: int = None) -> Optional[float]:
+        """Seconds to wait before retry number `attempt + 1`, or None to give up."""
+        if max_retries is None:
+            max_retries = self.max_retries
+        if attempt >= max_retries:
+            return None
+
+        if retry_after is not None:
+            if retry_after > self.max_delay:
+                return None
+            delay = retry_after + random.uniform(0, self.base_delay)
+        else:
+            # Full jitter: https://aws.amazon.com/blogs/architecture/exponential-backoff-and-jitter/
+            delay = random.uniform(0, self.backoff(attempt))
+
+        if not self.budget.try_acquire():
+            return None
+        return delay
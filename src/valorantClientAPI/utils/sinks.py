@@ -0,0 +1,44 @@
+# Writers that stream rows (dicts) to NDJSON or CSV files.
+import csv
+import json
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, TextIO, Union
+
+FORMATS = ("ndjson", "csv")
+
+
+@contextmanager
+def open_sink(sink: Union[str, TextIO], format: str = None) -> Iterator[Callable[[Dict], None]]:
+    """
+    Opens a path or uses a text file object and yields a `write(row)` function.
+    format is "ndjson" or "csv", guessed from the file extension if not given.
+    CSV columns are taken from the first row, nested values are written as json.
+    """
+    if format is None:
+        name = sink if isinstance(sink, str) else getattr(sink, "name", "")
+        format = "csv" if str(name).lower().endswith(".csv") else "ndjson"
+    if format not in FORMATS:
+        raise ValueError(f"Invalid format. Valid formats: {FORMATS}")
+
+    file = open(sink, "w", newline="", encoding="utf-8") if isinstance(sink, str) else sink
+    try:
+        if format == "ndjson":
+            def write(row: Dict) -> None:
+                file.write(json.dumps(row, separators=(",", ":")))
+                file.write("\n")
+        else:
+            writer = None
+
+            def write(row: Dict) -> None:
+                nonlocal writer
+                if writer is None:
+                    writer = csv.DictWriter(file, fieldnames=list(row), extrasaction="ignore")
+                    writer.writeheader()
+                writer.writerow({
+                    key: json.dumps(value) if isinstance(value, (dict, list)) else value
+                    for key, value in row.items()
+                })
+        yield write
+    finally:
+        if isinstance(sink, str):
+            file.close()
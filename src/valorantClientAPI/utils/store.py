@@ -0,0 +1,128 @@
+# Persistent store for match details. A completed match never changes,
+# so once fetched it can be read back from disk instead of the network.
+import asyncio
+import json
+import sqlite3
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+
+from . import jsonlib
+
+
+class MatchStore:
+    def __init__(self, path: str, max_bytes: Optional[int] = None, max_entries: Optional[int] = None,
+                 compression_level: int = 6):
+        """
+        Keeps zlib compressed match details in a SQLite database at `path`.
+        When the store grows past `max_bytes` (compressed) or `max_entries`,
+        the least recently read matches are evicted.
+        All database access runs on one background thread, so the store can be
+        shared by any number of coroutines.
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.compression_level = compression_level
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="MatchStore")
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS matches ("
+                "match_id TEXT PRIMARY KEY, data BLOB NOT NULL, size INTEGER NOT NULL, last_access REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS matches_last_access ON matches (last_access)")
+            self._conn.commit()
+        return self._conn
+
+    async def _run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    def _get(self, match_id: str) -> Optional[bytes]:
+        conn = self._connect()
+        row = conn.execute("SELECT data FROM matches WHERE match_id = ?", (match_id,)).fetchone()
+        if row is None:
+            return None
+        conn.execute("UPDATE matches SET last_access = ? WHERE match_id = ?", (time.time(), match_id))
+        conn.commit()
+        return row[0]
+
+    def _put(self, match_id: str, blob: bytes) -> None:
+        conn = self._connect()
+        conn.execute(
+            "INSERT OR REPLACE INTO matches (match_id, data, size, last_access) VALUES (?, ?, ?, ?)",
+            (match_id, blob, len(blob), time.time()),
+        )
+        self._evict(conn)
+        conn.commit()
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        if self.max_entries is not None:
+            conn.execute(
+                "DELETE FROM matches WHERE match_id IN ("
+                "SELECT match_id FROM matches ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+        if self.max_bytes is not None:
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM matches").fetchone()[0]
+            if total > self.max_bytes:
+                rows = conn.execute("SELECT match_id, size FROM matches ORDER BY last_access ASC").fetchall()
+                evicted = []
+                for match_id, size in rows:
+                    if total <= self.max_bytes:
+                        break
+                    evicted.append((match_id,))
+                    total -= size
+                conn.executemany("DELETE FROM matches WHERE match_id = ?", evicted)
+
+    def _delete(self, match_id: str) -> None:
+        conn = self._connect()
+        conn.execute("DELETE FROM matches WHERE match_id = ?", (match_id,))
+        conn.commit()
+
+    def _stats(self) -> Dict[str, int]:
+        count, size = self._connect().execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM matches").fetchone()
+        return {"entries": count, "bytes": size}
+
+    def _close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    async def get(self, match_id: str) -> Optional[Dict]:
+        """Gets the stored match details json, None if the match isn't stored."""
+        body = await self.get_bytes(match_id)
+        if body is None:
+            return None
+        return jsonlib.decode(body)
+
+    async def get_bytes(self, match_id: str) -> Optional[bytes]:
+        """Gets the stored match details as an encoded json body."""
+        blob = await self._run(self._get, match_id)
+        if blob is None:
+            return None
+        return zlib.decompress(blob)
+
+    async def put(self, match_id: str, data: Dict) -> None:
+        """Stores the match details json of a match."""
+        await self.put_bytes(match_id, json.dumps(data, separators=(",", ":")).encode())
+
+    async def put_bytes(self, match_id: str, body: bytes) -> None:
+        """Stores an encoded json body as it is, e.g. a raw response."""
+        await self._run(self._put, match_id, zlib.compress(body, self.compression_level))
+
+    async def delete(self, match_id: str) -> None:
+        await self._run(self._delete, match_id)
+
+    async def stats(self) -> Dict[str, int]:
+        """Number of stored matches & their compressed size in bytes."""
+        return await self._run(self._stats)
+
+    async def close(self) -> None:
+        await self._run(self._close)
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,200 @@
+# Connection-level tracing through aiohttp's TraceConfig: dns resolution, connection
+# setup, keep-alive reuse and time to first byte of every request, tagged with the
+# Client method that sent it (read from the `current_call` context var of metrics).
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, List, Optional
+
+import aiohttp
+
+from .metrics import current_call
+
+try:
+    from opentelemetry import trace as otel_trace
+except ImportError:  # pragma: no cover
+    otel_trace = None
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TraceEvent:
+    """
+    One HTTP request. Times are in seconds, None for steps the request didn't go through.
+    queued is spent waiting for a free connection of the pool, dns resolving the host
+    (dns_cache_hit when the connector's cache answered), connect opening a new connection,
+    TLS handshake included as aiohttp doesn't time it apart (tls tells whether there was one).
+    reused is True when a pooled keep-alive connection was used instead. ttfb runs from the
+    request headers being sent to the response headers, total from the start of the request
+    to the response headers. Steps of redirects add up, endpoint is the Client method that
+    sent the request, None outside of one (e.g. RiotAuth's own requests).
+    """
+    endpoint: Optional[str]
+    method: str
+    url: str
+    host: Optional[str]
+    start: float
+    status: Optional[int] = None
+    reused: bool = False
+    tls: bool = False
+    queued: Optional[float] = None
+    dns: Optional[float] = None
+    dns_cache_hit: Optional[bool] = None
+    connect: Optional[float] = None
+    ttfb: Optional[float] = None
+    total: float = 0.0
+    redirects: int = 0
+    error: Optional[str] = None
+
+
+def _add(current: Optional[float], value: float) -> float:
+    return value if current is None else current + value
+
+
+class Tracer:
+    def __init__(self, keep: int = 1000, opentelemetry: bool = False):
+        """
+        Builds a TraceEvent for every request of the sessions its trace_config is attached to.
+        The last `keep` events are kept in `events` and observers are called with each of them.
+        With `opentelemetry` every event is also exported as a client span of the global
+        tracer provider, child of the span that's current when the request is sent
+        (requires opentelemetry-api).
+        A Tracer can be shared by several clients.
+        """
+        if opentelemetry and otel_trace is None:
+            raise ImportError("opentelemetry export requires opentelemetry-api: pip install opentelemetry-api")
+        self.events: Deque[TraceEvent] = deque(maxlen=keep)
+        self.observers: List[Callable[[TraceEvent], None]] = []
+        self._otel = otel_trace.get_tracer("valorantClientAPI") if opentelemetry else None
+        self._config: Optional[aiohttp.TraceConfig] = None
+
+    def subscribe(self, observer: Callable[[TraceEvent], None]) -> None:
+        """Calls `observer` with the TraceEvent of every finished request. Its errors are logged, not raised."""
+        self.observers.append(observer)
+
+    def unsubscribe(self, observer: Callable[[TraceEvent], None]) -> None:
+        self.observers.remove(observer)
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """The TraceConfig to pass in aiohttp.ClientSession(trace_configs=[...])."""
+        if self._config is None:
+            config = aiohttp.TraceConfig()
+            config.on_request_start.append(self._on_request_start)
+            config.on_connection_queued_start.append(self._on_step_start)
+            config.on_connection_queued_end.append(self._on_queued_end)
+            config.on_dns_resolvehost_start.append(self._on_step_start)
+            config.on_dns_resolvehost_end.append(self._on_dns_end)
+            config.on_dns_cache_hit.append(self._on_dns_cache_hit)
+            config.on_dns_cache_miss.append(self._on_dns_cache_miss)
+            config.on_connection_create_start.append(self._on_connect_start)
+            config.on_connection_create_end.append(self._on_connect_end)
+            config.on_connection_reuseconn.append(self._on_reuseconn)
+            config.on_request_headers_sent.append(self._on_headers_sent)
+            config.on_request_redirect.append(self._on_redirect)
+            config.on_request_end.append(self._on_request_end)
+            config.on_request_exception.append(self._on_request_exception)
+            self._config = config
+        return self._config
+
+    # aiohttp gives every request its own trace_config_ctx, the event is built on it
+
+    async def _on_request_start(self, session, ctx, params) -> None:
+        call = current_call.get()
+        url = params.url
+        ctx.event = TraceEvent(
+            endpoint=call.endpoint if call is not None else None,
+            method=params.method,
+            url=str(url),
+            host=url.host,
+            start=time.time(),
+            tls=url.scheme in ("https", "wss"),
+        )
+        ctx.started = time.perf_counter()
+        ctx.step = ctx.connect_step = ctx.headers_sent = None
+
+    async def _on_step_start(self, session, ctx, params) -> None:
+        ctx.step = time.perf_counter()
+
+    async def _on_queued_end(self, session, ctx, params) -> None:
+        ctx.event.queued = _add(ctx.event.queued, time.perf_counter() - ctx.step)
+
+    async def _on_dns_end(self, session, ctx, params) -> None:
+        ctx.event.dns = _add(ctx.event.dns, time.perf_counter() - ctx.step)
+
+    async def _on_dns_cache_hit(self, session, ctx, params) -> None:
+        ctx.event.dns_cache_hit = True
+
+    async def _on_dns_cache_miss(self, session, ctx, params) -> None:
+        ctx.event.dns_cache_hit = False
+
+    async def _on_connect_start(self, session, ctx, params) -> None:
+        # dns resolution happens within connection creation, so it has its own start
+        ctx.connect_step = time.perf_counter()
+
+    async def _on_connect_end(self, session, ctx, params) -> None:
+        ctx.event.connect = _add(ctx.event.connect, time.perf_counter() - ctx.connect_step)
+
+    async def _on_reuseconn(self, session, ctx, params) -> None:
+        ctx.event.reused = True
+
+    async def _on_headers_sent(self, session, ctx, params) -> None:
+        ctx.headers_sent = time.perf_counter()
+
+    async def _on_redirect(self, session, ctx, params) -> None:
+        ctx.event.redirects += 1
+        if ctx.headers_sent is not None:
+            ctx.event.ttfb = _add(ctx.event.ttfb, time.perf_counter() - ctx.headers_sent)
+            ctx.headers_sent = None
+
+    async def _on_request_end(self, session, ctx, params) -> None:
+        now = time.perf_counter()
+        event = ctx.event
+        event.status = params.response.status
+        event.ttfb = _add(event.ttfb, now - (ctx.headers_sent if ctx.headers_sent is not None else ctx.started))
+        event.total = now - ctx.started
+        self._emit(event)
+
+    async def _on_request_exception(self, session, ctx, params) -> None:
+        event = ctx.event
+        event.error = type(params.exception).__name__
+        event.total = time.perf_counter() - ctx.started
+        self._emit(event)
+
+    def _emit(self, event: TraceEvent) -> None:
+        self.events.append(event)
+        if self._otel is not None:
+            self._export(event)
+        for observer in self.observers:
+            # Runs inside aiohttp's request, tracing must never break it
+            try:
+                observer(event)
+            except Exception:
+                logger.exception("trace observer %r failed", observer)
+
+    def _export(self, event: TraceEvent) -> None:
+        start = int(event.start * 1e9)
+        attributes = {
+            "http.method": event.method,
+            "http.url": event.url,
+            "net.peer.name": event.host,
+            "http.status_code": event.status,
+            "valorant.endpoint": event.endpoint,
+            "valorant.connection_reused": event.reused,
+            "valorant.queued_s": event.queued,
+            "valorant.dns_s": event.dns,
+            "valorant.dns_cache_hit": event.dns_cache_hit,
+            "valorant.connect_s": event.connect,
+            "valorant.ttfb_s": event.ttfb,
+            "valorant.redirects": event.redirects,
+        }
+        span = self._otel.start_span(
+            f"{event.method} {event.endpoint or event.host}",
+            kind=otel_trace.SpanKind.CLIENT,
+            start_time=start,
+            attributes={key: value for key, value in attributes.items() if value is not None},
+        )
+        if event.error is not None:
+            span.set_status(otel_trace.Status(otel_trace.StatusCode.ERROR, event.error))
+        span.end(end_time=start + int(event.total * 1e9))
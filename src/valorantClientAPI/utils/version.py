@@ -0,0 +1,135 @@
+# Caches the client version & riot client build from valorant-api.com.
+# They only change with a patch, so they are fetched once per process
+# (or once per `ttl`) and shared by every Client and RiotAuth instance.
+import asyncio
+import json
+import os
+import time
+import weakref
+from typing import Dict, Optional
+
+import aiohttp
+import requests
+
+VERSION_URL = "https://valorant-api.com/v1/version"
+
+
+class VersionCache:
+    def __init__(self, ttl: float = 3600, path: str = None):
+        """
+        ttl: seconds before the cached versions are fetched again.
+        path: optional json file the versions are persisted to, so a restart
+        does not need to fetch them.
+        """
+        self.ttl = ttl
+        self.path = path
+        self.overrides: Dict[str, str] = {}
+        self._data: Optional[Dict] = None
+        self._fetched_at: float = 0
+        # One lock per event loop: the cache outlives loops (e.g. several asyncio.run calls)
+        self._locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = weakref.WeakKeyDictionary()
+        if path is not None:
+            self._load()
+
+    def set_override(self, client_version: str = None, riot_client_build: str = None) -> None:
+        """Sets versions to use instead of fetching them, e.g. when running offline."""
+        if client_version is not None:
+            self.overrides["riotClientVersion"] = client_version
+        if riot_client_build is not None:
+            self.overrides["riotClientBuild"] = riot_client_build
+
+    def clear(self) -> None:
+        """Forgets the cached versions so the next lookup fetches them again."""
+        self._data = None
+        self._fetched_at = 0
+
+    def _fresh(self) -> bool:
+        return self._data is not None and time.time() - self._fetched_at < self.ttl
+
+    def _store(self, data: Dict) -> None:
+        self._data = data
+        self._fetched_at = time.time()
+        if self.path is not None:
+            try:
+                with open(self.path, "w") as file:
+                    json.dump({"fetched_at": self._fetched_at, "data": data}, file)
+            except OSError:
+                pass
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, "r") as file:
+                stored = json.load(file)
+            self._data = stored["data"]
+            self._fetched_at = stored["fetched_at"]
+        except (OSError, ValueError, KeyError, TypeError):
+            self.clear()
+
+    def get(self, key: str) -> str:
+        """Gets a version, fetching it synchronously if the cache is stale."""
+        if key in self.overrides:
+            return self.overrides[key]
+        if not self._fresh():
+            resp = requests.get(VERSION_URL)
+            self._store(resp.json()["data"])
+        return self._data[key]
+
+    async def get_async(self, key: str, session: aiohttp.ClientSession = None) -> str:
+        """Gets a version without blocking the event loop.
+        Concurrent callers share one fetch.
+        """
+        if key in self.overrides:
+            return self.overrides[key]
+        if self._fresh():
+            return self._data[key]
+
+        loop = asyncio.get_running_loop()
+        lock = self._locks.get(loop)
+        if lock is None:
+            lock = self._locks[loop] = asyncio.Lock()
+        async with lock:
+            if not self._fresh():
+                if session is None:
+                    async with aiohttp.ClientSession() as own_session:
+                        self._store(await _fetch(own_session))
+                else:
+                    self._store(await _fetch(session))
+        return self._data[key]
+
+
+async def _fetch(session: aiohttp.ClientSession) -> Dict:
+    async with session.get(VERSION_URL) as resp:
+        return (await resp.json(content_type=None))["data"]
+
+
+version_cache = VersionCache()
+
+
+def configure(ttl: float = None, path: str = None, client_version: str = None, riot_client_build: str = None) -> VersionCache:
+    """Configures the process-wide version cache.
+    Pass in `client_version` and `riot_client_build` to never hit the network.
+    """
+    if ttl is not None:
+        version_cache.ttl = ttl
+    if path is not None and path != version_cache.path:
+        version_cache.path = path
+        if os.path.exists(path):
+            version_cache._load()
+    version_cache.set_override(client_version, riot_client_build)
+    return version_cache
+
+
+def get_client_version() -> str:
+    return version_cache.get("riotClientVersion")
+
+
+def get_riot_client_build() -> str:
+    return version_cache.get("riotClientBuild")
+
+
+async def get_client_version_async(session: aiohttp.ClientSession = None) -> str:
+    return await version_cache.get_async("riotClientVersion", session)
+
+
+async def get_riot_client_build_async(session: aiohttp.ClientSession = None) -> str:
+    return await version_cache.get_async("riotClientBuild", session)